@@ -0,0 +1,96 @@
+'''
+Micro-benchmark da camada matemática: np.matrix (implementação antiga) contra ndarray com @.
+
+Executar a partir da raiz do projeto: `python3 -m benchmarks.matrix_benchmark`
+'''
+
+from functools import partial
+from math import cos, radians, sin
+from timeit import timeit
+
+import numpy as np
+
+from source.backend.math.matrix import Matrix
+from source.backend.math.vector import Vector
+
+
+def build_rotation_matrix_legacy(rotation: Vector) -> np.matrix:
+    '''
+    Construção da matriz de rotação com np.matrix, como era feita antes.
+    '''
+
+    sinx = sin(radians(rotation.x))
+    cosx = cos(radians(rotation.x))
+    siny = sin(radians(rotation.y))
+    cosy = cos(radians(rotation.y))
+    sinz = sin(radians(rotation.z))
+    cosz = cos(radians(rotation.z))
+
+    rotation_x = np.matrix([[1.0, 0.0, 0.0, 0.0],
+                            [0.0, cosx, -sinx, 0.0],
+                            [0.0, sinx, cosx, 0.0],
+                            [0.0, 0.0, 0.0, 1.0]])
+
+    rotation_y = np.matrix([[cosy, 0.0, siny, 0.0],
+                            [0.0, 1.0, 0.0, 0.0],
+                            [-siny, 0.0, cosy, 0.0],
+                            [0.0, 0.0, 0.0, 1.0]])
+
+    rotation_z = np.matrix([[cosz, -sinz, 0.0, 0.0],
+                            [sinz, cosz, 0.0, 0.0],
+                            [0.0, 0.0, 1.0, 0.0],
+                            [0.0, 0.0, 0.0, 1.0]])
+
+    return rotation_z @ rotation_y @ rotation_x
+
+
+def multiply_vectors_legacy(matrix: np.matrix, vectors: list[Vector]) -> list[Vector]:
+    '''
+    Multiplicação de uma lista de vetores por uma np.matrix, como era feita antes.
+    '''
+
+    internal_vectors = np.stack([coord.internal_vector_4d for coord in vectors])
+    internal_vectors = np.transpose(internal_vectors)
+    transformed_vectors = matrix @ internal_vectors
+
+    return [Vector(transformed_vectors[0, i], transformed_vectors[1, i], transformed_vectors[2, i])
+            for i in range(transformed_vectors.shape[1])]
+
+
+def report(name: str, legacy: float, current: float) -> None:
+    '''
+    Mostra o resultado de uma comparação.
+    '''
+
+    print(f'{name:<48} legacy: {legacy * 1e3:9.3f} ms   current: {current * 1e3:9.3f} ms   '
+          f'speedup: {legacy / current:6.1f}x')
+
+
+def main() -> None:
+    '''
+    Executa os benchmarks.
+    '''
+
+    rotation = Vector(10.0, 20.0, 30.0)
+    repetitions = 2000
+
+    report(f'rotation matrix construction (x{repetitions})',
+           timeit(lambda: build_rotation_matrix_legacy(rotation), number=repetitions),
+           timeit(lambda: Matrix.build_rotation_matrix(rotation), number=repetitions))
+
+    legacy_matrix = build_rotation_matrix_legacy(rotation)
+    matrix = Matrix.build_rotation_matrix(rotation)
+
+    for vertex_count in (1_000, 100_000):
+        coords = np.random.default_rng(0).uniform(-100.0, 100.0, (vertex_count, 3))
+        vectors = [Vector(x, y, z) for x, y, z in coords]
+        homogeneous = Matrix.to_homogeneous(coords)
+        repetitions = 5
+
+        report(f'batched multiplication, {vertex_count} vertices (x{repetitions})',
+               timeit(partial(multiply_vectors_legacy, legacy_matrix, vectors), number=repetitions),
+               timeit(partial(Matrix.multiply_vectors, matrix, homogeneous), number=repetitions))
+
+
+if __name__ == '__main__':
+    main()
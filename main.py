@@ -2,11 +2,22 @@
 Sistema Gráfico Interativo (SGI)
 '''
 
-import gi
-gi.require_version('Gtk', '3.0')
 
-#pylint: disable=wrong-import-position
-from source.sgi import SGI
+def main() -> None:
+    '''
+    Cria e executa a interface.
+    '''
 
-sgi = SGI()
-sgi.run()
+    # O GTK só é importado aqui porque os processos de leitura paralela reimportam este módulo ao iniciar
+    #pylint: disable=import-outside-toplevel
+    import gi
+    gi.require_version('Gtk', '3.0')
+
+    from source.sgi import SGI
+
+    sgi = SGI()
+    sgi.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -2,154 +2,104 @@
 Módulo para o gerenciamento de arquivos.
 '''
 
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterator
+import os
+
+from source.backend.load_statistics import LoadStatistics
+from source.backend.native_format import NativeFormat
+from source.backend.obj_reader import ObjReader
+from source.backend.obj_writer import ObjWriter
 from source.backend.objects.object import Object
-from source.backend.objects.wireframes_3d import Wireframe3D
-from source.backend.math.vector import Vector
+from source.backend.scene_cache import SceneCache
+from source.backend.scene_io import SceneIO
+
+if TYPE_CHECKING:
+    from threading import Event
 
 
 class FileSystem():
     '''
-    Sistema de arquivos.
+    Sistema de arquivos, que escolhe o formato e a forma de leitura de cada arquivo.
     '''
 
+    PARALLEL_THRESHOLD: int = 1 << 26
+
+    statistics: LoadStatistics
+
+    def __init__(self) -> None:
+        self.statistics = LoadStatistics()
+
     def load_scene(self, file_name: str) -> list[Object]:
         '''
         Carrega um arquivo.
         '''
 
-        obj_file = ''
-
-        try:
-            with open(file_name, 'r', encoding='utf-8') as file:
-                obj_file = file.readlines()
-        except FileNotFoundError:
-            print('File not found')
-
-        data_objects = []
-        objects = []
-        vertices = []
-
-        for line in obj_file:
+        return list(self.iter_scene(file_name))
 
-            data = line.split()
-
-            if len(data) > 0:
+    def iter_scene(self,
+                   file_name: str,
+                   block_size: int = 1 << 22,
+                   worker_count: int | None = None,
+                   cancel_event: Event | None = None) -> Iterator[Object]:
+        '''
+        Lê um arquivo aos poucos, gerando cada objeto assim que o bloco "o" dele termina.
 
-                if data[0].startswith('#'):
-                    continue
+        Se existir um cache binário válido para o arquivo, os objetos vêm dele; senão o cache é escrito ao fim da
+        leitura. Arquivos com a extensão nativa (.sgi) são mapeados diretamente por NativeFormat. Arquivos grandes
+        são lidos em paralelo por ObjReader.iter_chunks quando há mais de um processador (ou worker_count > 1); os
+        demais, em sequência por ObjReader.iter_blocks. Quando cancel_event é sinalizado, a leitura para no
+        próximo bloco ou pedaço, mesmo no meio de um objeto, e o cache não é escrito.
+        '''
 
-                match data[0]:
-                    case 'v':
-                        vertices.append(Vector(float(data[1]), float(data[2]), float(data[3])))
-                    case 'p':
-                        index = int(data[1])
-                        if index > 0:
-                            index -= 1
-                        data_objects[-1].add_vertices([vertices[index]])
-                    case 'l':
-                        data_objects[-1].add_vertex(int(data[1]))
-                        data_objects[-1].add_vertex(int(data[2]))
-                        data_objects[-1].add_lines((0, 1))
-                    case 'f':
-                        lines = []
+        self.statistics = LoadStatistics()
 
-                        v_list = []
-                        vt_list = []
-                        vn_list = []
+        try:
+            source_stat = os.stat(file_name)
+        except FileNotFoundError:
+            print('File not found')
+            return
 
-                        for vector_set in data[1:]:
-                            vectors = list(map(int, vector_set.split('/')))
+        self.statistics.file_size = source_stat.st_size
 
-                            if len(vectors) == 3:
-                                v_list.append(vectors[0])
-                                vt_list.append(vectors[1])
-                                vn_list.append(vectors[2])
-                            elif len(vectors) == 2:
-                                if vector_set.count('/') == 2:
-                                    v_list.append(vectors[0])
-                                    vn_list.append(vectors[1])
-                                else:
-                                    v_list.append(vectors[0])
-                                    vt_list.append(vectors[1])
-                            else:
-                                v_list.append(vectors[0])
+        if os.path.splitext(file_name)[1] == NativeFormat.EXTENSION:
+            objects = NativeFormat.read(file_name, self.statistics)
+            self.statistics.read_byte_count = source_stat.st_size
+            yield from objects
+            return
 
-                        offset = len(data_objects[-1].vertices)
+        cached_objects = SceneCache.read(file_name, source_stat, self.statistics)
 
-                        for i, v in enumerate(v_list):
-                            index = v
-                            if index > 0:
-                                index -= 1
+        if cached_objects is not None:
+            self.statistics.read_byte_count = source_stat.st_size
+            yield from cached_objects
+            return
 
-                            data_objects[-1].add_vertex(vertices[index])
+        if worker_count is None:
+            worker_count = os.cpu_count() or 1
 
-                            if i < len(v_list) - 1:
-                                lines.append((offset + i, offset + i + 1))
+        reader = ObjReader(self.statistics)
 
-                        lines.append((offset + len(v_list) - 1, offset + 0))
+        if worker_count > 1 and source_stat.st_size >= FileSystem.PARALLEL_THRESHOLD:
+            objects = reader.iter_chunks(file_name, source_stat.st_size, worker_count, cancel_event)
+        else:
+            objects = reader.iter_blocks(file_name, block_size, cancel_event)
 
-                        data_objects[-1].add_lines(lines)
-                    case 'o':
-                        data_objects.append(ObjectData(data[1]))
-                    case _:
-                        pass
+        cache_entries = []
 
-        for data_obj in data_objects:
-            objects.append(data_obj.build_object())
+        for obj in objects:
+            cache_entries.append((SceneIO.object_attributes(obj), obj.coords, obj.lines))
+            yield obj
 
-        return objects
+        if not ObjReader.is_cancelled(cancel_event):
+            SceneCache.write(file_name, source_stat, cache_entries, self.statistics)
 
     def save_scene(self, file_name: str, objects: list[Object]) -> None:
         '''
         Escreve um arquivo.
         '''
 
-        raise NotImplementedError
-
-
-class ObjectData():
-
-    '''
-    Descritor de objetos.
-    '''
-
-    vertices: list[Vector]
-
-    _name: str
-    _lines: list[tuple[int]]
-    _material: tuple[float]
-
-    def __init__(self, name: str) -> None:
-        self.vertices = []
-        self._name = name
-        self._lines = []
-        self._lines = []
-        self._material = (1.0, 1.0, 1.0)
-
-    def add_vertex(self, vertex: Vector) -> None:
-        '''
-        Adiciona vértices.
-        '''
-
-        self.vertices.append(vertex)
-
-    def add_lines(self, faces: list[tuple[int]]) -> None:
-        '''
-        Adiciona faces.
-        '''
-
-        self._lines += faces
-
-    def add_material(self, material: tuple[float]) -> None:
-        '''
-        Adiciona um material.
-        '''
-
-        self._material = material
-
-    def build_object(self) -> Object:
-        '''
-        Processa os dados e gera um objeto.
-        '''
-
-        return Wireframe3D(self.vertices, self._lines, self._name)
+        if os.path.splitext(file_name)[1] == NativeFormat.EXTENSION:
+            NativeFormat.write(file_name, objects)
+        else:
+            ObjWriter.write(file_name, objects)
@@ -0,0 +1,44 @@
+'''
+Módulo para as estatísticas de carregamento.
+'''
+
+
+class LoadStatistics():
+
+    '''
+    Estatísticas do último carregamento.
+    '''
+
+    object_count: int
+    vertex_count: int
+    edge_count: int
+    removed_edge_count: int
+    read_byte_count: int
+    file_size: int
+    cache_error: OSError | None
+
+    def __init__(self) -> None:
+        self.object_count = 0
+        self.vertex_count = 0
+        self.edge_count = 0
+        self.removed_edge_count = 0
+        self.read_byte_count = 0
+        self.file_size = 0
+        self.cache_error = None
+
+    def __str__(self) -> str:
+        text = f'{self.object_count} objects, {self.vertex_count} vertices, {self.edge_count} edges ' \
+               f'({self.removed_edge_count} duplicated edges removed)'
+
+        if self.cache_error is not None:
+            text += f'; cache not written: {self.cache_error}'
+
+        return text
+
+    @property
+    def progress(self) -> float:
+        '''
+        Retorna a fração do arquivo já lida.
+        '''
+
+        return self.read_byte_count / self.file_size if self.file_size > 0 else 0.0
@@ -14,18 +14,18 @@ class Matrix():
     '''
 
     @staticmethod
-    def build_translation_matrix(direction: Vector) -> np.matrix:
+    def build_translation_matrix(direction: Vector) -> np.ndarray:
         '''
         Constrói a matriz de translação.
         '''
 
-        return np.matrix([[1.0, 0.0, 0.0, direction.x],
-                          [0.0, 1.0, 0.0, direction.y],
-                          [0.0, 0.0, 1.0, direction.z],
-                          [0.0, 0.0, 0.0, 1.0]])
+        return np.array([[1.0, 0.0, 0.0, direction.x],
+                         [0.0, 1.0, 0.0, direction.y],
+                         [0.0, 0.0, 1.0, direction.z],
+                         [0.0, 0.0, 0.0, 1.0]])
 
     @staticmethod
-    def build_rotation_matrix(rotation: Vector, inverse: bool = False) -> np.matrix:
+    def build_rotation_matrix(rotation: Vector, inverse: bool = False) -> np.ndarray:
         '''
         Constrói a matriz de rotação.
         '''
@@ -37,20 +37,20 @@ class Matrix():
         sinz = sin(radians(rotation.z))
         cosz = cos(radians(rotation.z))
 
-        rotation_x = np.matrix([[1.0, 0.0, 0.0, 0.0],
-                                [0.0, cosx, -sinx, 0.0],
-                                [0.0, sinx, cosx, 0.0],
-                                [0.0, 0.0, 0.0, 1.0]])
+        rotation_x = np.array([[1.0, 0.0, 0.0, 0.0],
+                               [0.0, cosx, -sinx, 0.0],
+                               [0.0, sinx, cosx, 0.0],
+                               [0.0, 0.0, 0.0, 1.0]])
 
-        rotation_y = np.matrix([[cosy, 0.0, siny, 0.0],
-                                [0.0, 1.0, 0.0, 0.0],
-                                [-siny, 0.0, cosy, 0.0],
-                                [0.0, 0.0, 0.0, 1.0]])
+        rotation_y = np.array([[cosy, 0.0, siny, 0.0],
+                               [0.0, 1.0, 0.0, 0.0],
+                               [-siny, 0.0, cosy, 0.0],
+                               [0.0, 0.0, 0.0, 1.0]])
 
-        rotation_z = np.matrix([[cosz, -sinz, 0.0, 0.0],
-                                [sinz, cosz, 0.0, 0.0],
-                                [0.0, 0.0, 1.0, 0.0],
-                                [0.0, 0.0, 0.0, 1.0]])
+        rotation_z = np.array([[cosz, -sinz, 0.0, 0.0],
+                               [sinz, cosz, 0.0, 0.0],
+                               [0.0, 0.0, 1.0, 0.0],
+                               [0.0, 0.0, 0.0, 1.0]])
 
         if inverse:
             return rotation_x @ rotation_y @ rotation_z
@@ -58,20 +58,20 @@ class Matrix():
         return rotation_z @ rotation_y @ rotation_x
 
     @staticmethod
-    def build_scaling_matrix(scale: Vector) -> np.matrix:
+    def build_scaling_matrix(scale: Vector) -> np.ndarray:
         '''
         Constrói a matriz de escala.
         '''
 
-        return np.matrix([[scale.x, 0.0, 0.0, 0.0],
-                          [0.0, scale.y, 0.0, 0.0],
-                          [0.0, 0.0, scale.z, 0.0],
-                          [0.0, 0.0, 0.0, 1.0]])
+        return np.array([[scale.x, 0.0, 0.0, 0.0],
+                         [0.0, scale.y, 0.0, 0.0],
+                         [0.0, 0.0, scale.z, 0.0],
+                         [0.0, 0.0, 0.0, 1.0]])
 
     @staticmethod
     def build_normalization_matrix(window_position: Vector,
                                    window_z_rotation: float,
-                                   window_diff_scale: Vector) -> np.matrix:
+                                   window_diff_scale: Vector) -> np.ndarray:
         '''
         Constrói a matriz de normalização.
         '''
@@ -83,7 +83,7 @@ class Matrix():
         return scaling @ rotation @ translation
 
     @staticmethod
-    def build_projection_matrix(cop: Vector, normal: Vector) -> np.matrix:
+    def build_projection_matrix(cop: Vector, normal: Vector) -> np.ndarray:
         '''
         Constrói a matriz de projeção.
         '''
@@ -96,8 +96,7 @@ class Matrix():
             rotation_y = 360 - rotation_y
 
         normal_rotation_matrix = Matrix.build_rotation_matrix(Vector(0.0, rotation_y, 0.0))
-        new_normal = np.matmul(normal_rotation_matrix, normal.internal_vector_4d)
-        normal = Vector(new_normal[0, 0], new_normal[0, 1], new_normal[0, 2])
+        normal = Vector.from_array(normal_rotation_matrix @ normal.internal_vector_4d)
 
         rotation_x = degrees(Vector(0.0, 0.0, 1.0) * normal)
 
@@ -110,28 +109,42 @@ class Matrix():
         return rotation_x @ rotation_y @ translation
 
     @staticmethod
-    def build_perspective_matrix(cop_distance: float) -> np.matrix:
+    def build_perspective_matrix(cop_distance: float) -> np.ndarray:
         '''
         Constrói a matriz de perspectiva.
         '''
 
-        return np.matrix([[1.0, 0.0, 0.0, 0.0],
-                          [0.0, 1.0, 0.0, 0.0],
-                          [0.0, 0.0, 1.0, 0.0],
-                          [0.0, 0.0, 1.0 / cop_distance, 0.0]])
+        return np.array([[1.0, 0.0, 0.0, 0.0],
+                         [0.0, 1.0, 0.0, 0.0],
+                         [0.0, 0.0, 1.0, 0.0],
+                         [0.0, 0.0, 1.0 / cop_distance, 0.0]])
 
     @staticmethod
-    def multiply_vectors(matrix: np.matrix, vectors: list[Vector]) -> list[Vector]:
+    def build_step_matrix(steps: int) -> np.ndarray:
         '''
-        Multiplica uma lista de vetores por uma matriz.
+        Constrói a matriz (steps, 4) com as potências [t³, t², t, 1] de cada passo t em [0, 1).
         '''
 
-        if len(vectors) == 0:
-            return []
+        t = np.arange(steps) / steps
 
-        internal_vectors = np.stack([coord.internal_vector_4d for coord in vectors])
-        internal_vectors = np.transpose(internal_vectors)
-        transformed_vectors = matrix @ internal_vectors
+        return np.stack((t**3, t**2, t, np.ones(steps)), axis=1)
 
-        return [Vector(transformed_vectors[0, i], transformed_vectors[1, i], transformed_vectors[2, i])
-                for i in range(transformed_vectors.shape[1])]
+    @staticmethod
+    def to_homogeneous(coords: np.ndarray) -> np.ndarray:
+        '''
+        Completa um array de coordenadas (N, 2) ou (N, 3) para vértices homogêneos (N, 4).
+        '''
+
+        homogeneous = np.zeros((len(coords), 4))
+        homogeneous[:, :coords.shape[1]] = coords
+        homogeneous[:, 3] = 1.0
+
+        return homogeneous
+
+    @staticmethod
+    def multiply_vectors(matrix: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        '''
+        Multiplica um array de vértices homogêneos (N, 4) por uma matriz.
+        '''
+
+        return vectors @ matrix.T
@@ -13,12 +13,28 @@ class Transform():
 
     '''
     Transformada.
+
+    A decomposição em posição, rotação e escala é calculada sob demanda e mantida em cache até a matriz mudar.
     '''
 
-    _matrix: np.matrix
+    decomposition_count: int = 0
+
+    _version: int
+    _matrix: np.ndarray
+    _position: np.ndarray | None
+    _rotation: np.ndarray | None
+    _scale: np.ndarray | None
+
+    def __init__(self, position: Vector, matrix: np.ndarray | None = None) -> None:
+        self._version = 0
+
+        # Uma matriz de modelo dada substitui a translação para a posição
+        if matrix is None:
+            self._matrix = Matrix.build_translation_matrix(position)
+        else:
+            self._matrix = np.array(matrix, dtype=np.float64).reshape(4, 4)
 
-    def __init__(self, position: Vector) -> None:
-        self._matrix = Matrix.build_translation_matrix(position)
+        self._invalidate()
 
     def __repr__(self) -> str:
         return str(self)
@@ -26,15 +42,42 @@ class Transform():
     def __str__(self) -> str:
         return str(f'P: {self.position}, R: {self.rotation}, S: {self.scale}')
 
+    @staticmethod
+    def from_matrix(matrix: np.ndarray) -> 'Transform':
+        '''
+        Cria uma transformada a partir de uma matriz de modelo.
+        '''
+
+        return Transform(Vector(0.0, 0.0, 0.0), matrix)
+
+    @staticmethod
+    def reset_decomposition_count() -> int:
+        '''
+        Zera o contador de decomposições e retorna o valor anterior.
+        '''
+
+        count = Transform.decomposition_count
+        Transform.decomposition_count = 0
+
+        return count
+
+    @property
+    def version(self) -> int:
+        '''
+        Getter da versão, incrementada a cada mudança da matriz.
+        '''
+
+        return self._version
+
     @property
     def position(self) -> Vector:
         '''
         Getter da posição.
         '''
 
-        position = self._matrix[0:3, 3]
+        self._decompose()
 
-        return Vector(position[0, 0], position[1, 0], position[2, 0])
+        return Vector(0.0, 0.0, 0.0, self._position)
 
     @property
     def rotation(self) -> Vector:
@@ -42,17 +85,43 @@ class Transform():
         Getter da rotação.
         '''
 
-        rotation_matrix = self._matrix[0:3, 0:3]
+        self._decompose()
+
+        return Vector(0.0, 0.0, 0.0, self._rotation)
+
+    @property
+    def scale(self) -> Vector:
+        '''
+        Getter da escala.
+        '''
 
-        scale_x = np.linalg.norm(rotation_matrix[:, 0])
-        scale_y = np.linalg.norm(rotation_matrix[:, 1])
-        scale_z = np.linalg.norm(rotation_matrix[:, 2])
+        self._decompose()
+
+        return Vector(0.0, 0.0, 0.0, self._scale)
+
+    def _invalidate(self) -> None:
+        '''
+        Descarta a decomposição em cache.
+        '''
+
+        self._position = None
+        self._rotation = None
+        self._scale = None
+
+    def _decompose(self) -> None:
+        '''
+        Decompõe a matriz em posição, rotação (ângulos de Euler) e escala, se ainda não estiver em cache.
+        '''
 
-        normalized_rotation_matrix = np.array([
-            [rotation_matrix[0, 0] / scale_x, rotation_matrix[0, 1] / scale_y, rotation_matrix[0, 2] / scale_z],
-            [rotation_matrix[1, 0] / scale_x, rotation_matrix[1, 1] / scale_y, rotation_matrix[1, 2] / scale_z],
-            [rotation_matrix[2, 0] / scale_x, rotation_matrix[2, 1] / scale_y, rotation_matrix[2, 2] / scale_z]
-        ])
+        if self._position is not None:
+            return
+
+        Transform.decomposition_count += 1
+
+        rotation_matrix = self._matrix[0:3, 0:3]
+        scale = np.linalg.norm(rotation_matrix, axis=0)
+
+        normalized_rotation_matrix = rotation_matrix / scale
 
         sy = sqrt(normalized_rotation_matrix[0, 0] ** 2 + normalized_rotation_matrix[1, 0] ** 2)
 
@@ -67,47 +136,44 @@ class Transform():
             y_angle = atan2(-normalized_rotation_matrix[2, 0], sy)
             z_angle = 0
 
-        return Vector(degrees(x_angle), degrees(y_angle), degrees(z_angle))
+        self._position = self._matrix[0:3, 3].copy()
+        self._rotation = np.array([degrees(x_angle), degrees(y_angle), degrees(z_angle)])
+        self._scale = scale
 
-    @property
-    def scale(self) -> Vector:
+    def _apply(self, matrix: np.ndarray) -> None:
         '''
-        Getter da escala.
+        Aplica uma transformação relativa sobre a matriz acumulada.
         '''
 
-        rotation_matrix = self._matrix[0:3, 0:3]
+        self._matrix = matrix @ self._matrix
+        self._version += 1
+        self._invalidate()
 
-        scale_x = np.linalg.norm(rotation_matrix[:, 0])
-        scale_y = np.linalg.norm(rotation_matrix[:, 1])
-        scale_z = np.linalg.norm(rotation_matrix[:, 2])
+    @property
+    def matrix(self) -> np.ndarray:
+        '''
+        Getter da matriz de modelo acumulada.
+        '''
 
-        return Vector(scale_x, scale_y, scale_z)
+        return self._matrix
 
-    def get_translated(self, direction: Vector, coords: list[Vector]) -> tuple[list[Vector], np.matrix]:
+    def get_translation(self, direction: Vector) -> np.ndarray:
         '''
-        Obtém as coordenadas transladadas de um objeto e também retorna a matriz de translação.
+        Obtém a matriz de translação.
         '''
 
-        translation = Matrix.build_translation_matrix(direction)
+        return Matrix.build_translation_matrix(direction)
 
-        return Matrix.multiply_vectors(translation, coords), translation
-
-    def translate(self, direction: Vector, coords: list[Vector]) -> list[Vector]:
+    def translate(self, direction: Vector) -> None:
         '''
-        Translada um objeto e a transformada retornando uma nova lista de coordenadas.
+        Translada a transformada.
         '''
 
-        new_coords, translation = self.get_translated(direction, coords)
-        self._matrix = translation @ self._matrix
-
-        return new_coords
+        self._apply(self.get_translation(direction))
 
-    def get_rotated(self,
-                    rotation: Vector,
-                    coords: list[Vector],
-                    origin: Vector | None = None) -> tuple[list[Vector], np.matrix]:
+    def get_rotation(self, rotation: Vector, origin: Vector | None = None) -> np.ndarray:
         '''
-        Obtém as coordenadas rotacionadas de um objeto e também retorna a matriz de rotação.
+        Obtém a matriz de rotação em relação à um ponto.
         '''
 
         if origin is None:
@@ -117,94 +183,38 @@ class Transform():
         rotation = Matrix.build_rotation_matrix(rotation)
         relative_to_self_translation = Matrix.build_translation_matrix(origin)
 
-        relative_rotation = relative_to_self_translation @ rotation @ relative_to_origin_translation
+        return relative_to_self_translation @ rotation @ relative_to_origin_translation
 
-        return Matrix.multiply_vectors(relative_rotation, coords), relative_rotation
-
-    def rotate(self, rotation: Vector, coords: list[Vector], origin: Vector | None = None) -> list[Vector]:
+    def rotate(self, rotation: Vector, origin: Vector | None = None) -> None:
         '''
-        Rotaciona o objeto em relação à um ponto.
+        Rotaciona a transformada em relação à um ponto.
         '''
 
-        new_coords, rotation = self.get_rotated(rotation, coords, origin)
-        self._matrix = rotation @ self._matrix
-
-        return new_coords
+        self._apply(self.get_rotation(rotation, origin))
 
-    def get_scaled(self, scale: Vector, coords: list[Vector]) -> tuple[list[Vector], np.matrix]:
+    def get_scaling(self, scale: Vector) -> np.ndarray:
         '''
-        Obtém as coordenadas escaladas de um objeto e também retorna a matriz de escala.
+        Obtém a matriz de escala nos eixos locais.
         '''
 
-        relative_to_origin_translation = Matrix.build_translation_matrix(-self.position)
-        inverse_rotation = Matrix.build_rotation_matrix(-self.rotation, True)
+        position = self.position
+        rotation = self.rotation
+
+        relative_to_origin_translation = Matrix.build_translation_matrix(-position)
+        inverse_rotation = Matrix.build_rotation_matrix(-rotation, True)
         scaling = Matrix.build_scaling_matrix(scale)
-        rotation = Matrix.build_rotation_matrix(self.rotation)
-        relative_to_self_translation = Matrix.build_translation_matrix(self.position)
+        rotation = Matrix.build_rotation_matrix(rotation)
+        relative_to_self_translation = Matrix.build_translation_matrix(position)
 
-        relative_scaling = relative_to_self_translation @ \
+        return relative_to_self_translation @ \
             rotation @ \
             scaling @ \
             inverse_rotation @ \
             relative_to_origin_translation
 
-        return Matrix.multiply_vectors(relative_scaling, coords), relative_scaling
-
-    def rescale(self, scale: Vector, coords: list[Vector]) -> list[Vector]:
+    def rescale(self, scale: Vector) -> None:
         '''
         Transformação de escala.
         '''
 
-        new_coords, scaling = self.get_scaled(scale, coords)
-        self._matrix = scaling @ self._matrix
-
-        return new_coords
-
-    def normalize(self,
-                  window_position: Vector,
-                  window_z_rotation: float,
-                  window_diff_scale: Vector,
-                  coords: list[Vector]) -> list[Vector]:
-        '''
-        Normaliza as coordenadas.
-        '''
-
-        normalization = Matrix.build_normalization_matrix(window_position, window_z_rotation, window_diff_scale)
-
-        return Matrix.multiply_vectors(normalization, coords)
-
-    def project(self,
-                cop: Vector,
-                normal: Vector,
-                cop_distance: float,
-                coords: list[Vector],
-                is_window: bool = False) -> list[Vector]:
-        '''
-        Projeta as coordendas.
-        '''
-
-        if len(coords) == 0:
-            return []
-
-        projection_matrix = Matrix.build_projection_matrix(cop, normal)
-        perspective_matrix = Matrix.build_perspective_matrix(cop_distance)
-        transformation = projection_matrix if is_window else perspective_matrix @ projection_matrix
-
-        internal_vectors = np.stack([coord.internal_vector_4d for coord in coords])
-        internal_vectors = np.transpose(internal_vectors)
-        transformed_vectors = transformation @ internal_vectors
-        tranformed_coords = [Vector(transformed_vectors[0, i], transformed_vectors[1, i], transformed_vectors[2, i])
-                             for i in range(transformed_vectors.shape[1])]
-
-        if is_window:
-            return tranformed_coords
-
-        new_coords = []
-
-        for i in range(transformed_vectors.shape[1]):
-            if transformed_vectors[2, i] >= 0.0 and transformed_vectors[3, i] > 0.0:
-                new_coords.append(Vector(transformed_vectors[0, i] / transformed_vectors[3, i],
-                                         transformed_vectors[1, i] / transformed_vectors[3, i],
-                                         transformed_vectors[2, i] / transformed_vectors[3, i]))
-
-        return new_coords
+        self._apply(self.get_scaling(scale))
@@ -127,6 +127,22 @@ class Vector():
 
         return np.sqrt(self.internal_vector_3d.dot(self.internal_vector_3d))
 
+    @staticmethod
+    def from_array(array: np.ndarray) -> 'Vector':
+        '''
+        Cria um vetor a partir de uma linha de um array de vértices.
+        '''
+
+        return Vector(0.0, 0.0, 0.0, array[:3])
+
+    @staticmethod
+    def stack(vectors: list['Vector']) -> np.ndarray:
+        '''
+        Empilha os vetores em um array homogêneo (N, 4).
+        '''
+
+        return np.array([[vector.x, vector.y, vector.z, 1.0] for vector in vectors], dtype=float).reshape(-1, 4)
+
     def dot(self, other) -> float:
         '''
         Produto escalar.
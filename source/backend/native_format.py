@@ -0,0 +1,145 @@
+'''
+Módulo para o formato nativo de cenas (.sgi).
+'''
+
+import json
+import os
+import struct
+
+import numpy as np
+
+from source.backend.load_statistics import LoadStatistics
+from source.backend.objects.object import Object
+from source.backend.scene_io import SceneIO
+
+
+class NativeFormat():
+
+    '''
+    Formato nativo de cenas, mapeado diretamente na memória na leitura.
+    '''
+
+    EXTENSION: str = '.sgi'
+    VERSION: int = 1
+    ALIGNMENT: int = 64
+
+    # Assinatura, versão, tamanho do cabeçalho e posições das seções de vértices e de linhas
+    PREAMBLE: struct.Struct = struct.Struct('<8sIIQQ')
+    MAGIC: bytes = b'SGISCENE'
+
+    @staticmethod
+    def align(offset: int) -> int:
+        '''
+        Arredonda uma posição do arquivo nativo para o alinhamento das seções.
+        '''
+
+        return -(-offset // NativeFormat.ALIGNMENT) * NativeFormat.ALIGNMENT
+
+    @staticmethod
+    def read(file_name: str, statistics: LoadStatistics) -> list[Object]:
+        '''
+        Lê uma cena no formato nativo.
+
+        O arquivo tem um preâmbulo fixo, um cabeçalho JSON com os metadados dos objetos e duas seções alinhadas
+        de arrays little-endian: as coordenadas locais (N, 4) em float64 e as linhas (E, 2) em int64. As seções
+        são mapeadas com np.memmap e cada objeto recebe uma fatia delas, sem cópia; como os limites locais estão
+        no cabeçalho, só as páginas dos objetos que forem desenhados são lidas do disco.
+        '''
+
+        with open(file_name, 'rb') as file:
+            magic, version, header_size, vertex_section, line_section = \
+                NativeFormat.PREAMBLE.unpack(file.read(NativeFormat.PREAMBLE.size))
+
+            if magic != NativeFormat.MAGIC or version != NativeFormat.VERSION:
+                print('Unsupported scene file')
+                return []
+
+            header = json.loads(file.read(header_size))
+
+        vertices = NativeFormat.map_section(file_name, vertex_section, np.dtype('<f8'), (header['vertex_count'], 4))
+        lines = NativeFormat.map_section(file_name, line_section, np.dtype('<i8'), (header['line_count'], 2))
+        objects = []
+
+        for entry in header['objects']:
+            vertex_start, vertex_end = entry['vertices']
+            line_start, line_end = entry['lines']
+
+            objects.append(SceneIO.restore_object(entry,
+                                                  vertices[vertex_start:vertex_end],
+                                                  lines[line_start:line_end],
+                                                  np.array(entry['model_matrix']).reshape(4, 4),
+                                                  (entry['radius'],
+                                                   np.array(entry['box_center']),
+                                                   np.array(entry['box_half']))))
+
+        statistics.object_count = len(objects)
+        statistics.vertex_count = header['vertex_count']
+        statistics.edge_count = header['line_count']
+
+        return objects
+
+    @staticmethod
+    def map_section(file_name: str, offset: int, dtype: np.dtype, shape: tuple[int, int]) -> np.ndarray:
+        '''
+        Mapeia uma seção do arquivo nativo como um array somente leitura.
+        '''
+
+        if shape[0] == 0:
+            return np.empty(shape, dtype=dtype)
+
+        return np.memmap(file_name, dtype=dtype, mode='r', offset=offset, shape=shape).view(np.ndarray)
+
+    @staticmethod
+    def write(file_name: str, objects: list[Object]) -> None:
+        '''
+        Escreve uma cena no formato nativo (veja read).
+
+        Cada objeto guarda as coordenadas locais e a matriz de modelo, então a cena volta exatamente como estava.
+        '''
+
+        vertex_offsets = np.concatenate(([0], np.cumsum([len(obj.local_coords) for obj in objects], dtype=np.int64)))
+        line_offsets = np.concatenate(([0], np.cumsum([len(obj.lines) for obj in objects], dtype=np.int64)))
+        entries = []
+
+        for i, obj in enumerate(objects):
+            radius, box_center, box_half = obj.local_bounds
+
+            entries.append(SceneIO.object_attributes(obj) | {
+                            'model_matrix': obj.model_matrix.ravel().tolist(),
+                            'radius': float(radius),
+                            'box_center': box_center.tolist(),
+                            'box_half': box_half.tolist(),
+                            'vertices': [int(vertex_offsets[i]), int(vertex_offsets[i + 1])],
+                            'lines': [int(line_offsets[i]), int(line_offsets[i + 1])]})
+
+        header = json.dumps({'vertex_count': int(vertex_offsets[-1]),
+                             'line_count': int(line_offsets[-1]),
+                             'objects': entries}).encode('utf-8')
+
+        vertex_section = NativeFormat.align(NativeFormat.PREAMBLE.size + len(header))
+        line_section = NativeFormat.align(vertex_section + int(vertex_offsets[-1]) * 4 * 8)
+        temporary_path = file_name + '.tmp'
+
+        try:
+            with open(temporary_path, 'wb') as file:
+                file.write(NativeFormat.PREAMBLE.pack(NativeFormat.MAGIC,
+                                                      NativeFormat.VERSION,
+                                                      len(header),
+                                                      vertex_section,
+                                                      line_section))
+                file.write(header)
+                file.seek(vertex_section)
+
+                for obj in objects:
+                    file.write(np.ascontiguousarray(obj.local_coords, dtype='<f8').data)
+
+                file.seek(line_section)
+
+                for obj in objects:
+                    file.write(np.ascontiguousarray(obj.lines, dtype='<i8').data)
+
+            # O arquivo antigo pode estar mapeado por objetos da cena; a troca mantém os mapas válidos
+            os.replace(temporary_path, file_name)
+        except BaseException:
+            SceneIO.discard_file(temporary_path)
+            raise
@@ -0,0 +1,498 @@
+'''
+Módulo para a leitura de trechos de arquivos OBJ.
+'''
+
+from __future__ import annotations
+from typing import Iterator
+import json
+import warnings
+
+import numpy as np
+
+from source.backend.math.matrix import Matrix
+from source.backend.objects.object import Object
+from source.backend.objects.wireframes_3d import Wireframe3D
+from source.backend.scene_io import SceneIO
+
+
+class ObjParser():
+
+    '''
+    Leitor de trechos de arquivos OBJ, que gera a tabela de vértices e os descritores de objetos de um trecho.
+    '''
+
+    ATTRIBUTES_PREFIX: str = '#sgi '
+
+    @staticmethod
+    def resolve_index(index: int, vertex_count: int) -> int:
+        '''
+        Converte um índice de vértice do OBJ (a partir de 1, ou negativo e relativo ao fim) para um índice
+        a partir de 0.
+        '''
+
+        return index - 1 if index > 0 else vertex_count + index
+
+    def parse_bytes(self,
+                    segment: bytes,
+                    vertex_offset: int,
+                    continued: bool = False) -> tuple[np.ndarray, list[ObjectData]]:
+        '''
+        Lê um trecho do arquivo, retornando a tabela de vértices (N, 3) e os descritores de objetos.
+        '''
+
+        # O leitor em bloco cobre a sintaxe comum; o leitor linha a linha trata o resto
+        try:
+            return self.parse_obj_bulk(segment, vertex_offset, continued)
+        except ValueError:
+            return self.parse_obj_lines(segment.decode('utf-8').splitlines(), vertex_offset, continued)
+
+    def parse_obj_lines(self,
+                        obj_file: list[str],
+                        vertex_offset: int = 0,
+                        continued: bool = False) -> tuple[np.ndarray, list[ObjectData]]:
+        '''
+        Lê um arquivo OBJ linha a linha, retornando a tabela de vértices (N, 3) e os descritores de objetos.
+
+        Os índices são globais: vertex_offset é o número de vértices lidos antes deste trecho do arquivo. Com
+        continued, o trecho pode começar no meio de um objeto, e o primeiro descritor guarda os elementos que
+        vêm antes do primeiro "o". Sem continued, elementos antes do primeiro "o" formam um objeto sem nome.
+        Comentários no fim da linha e linhas continuadas com "\\" são aceitos, e um comentário "#sgi" guarda os
+        atributos do objeto (veja ObjWriter.format_object).
+        '''
+
+        data_objects = [ObjectData('')] if continued else []
+        vertices = []
+
+        for line in self.join_continued_lines(obj_file):
+
+            if line.startswith(ObjParser.ATTRIBUTES_PREFIX) and data_objects:
+                data_objects[-1].attributes = json.loads(line[len(ObjParser.ATTRIBUTES_PREFIX):])
+                continue
+
+            data = line.split('#', 1)[0].split()
+
+            if len(data) > 0:
+
+                if data[0] in ('p', 'l', 'f') and not data_objects:
+                    data_objects.append(ObjectData(''))
+
+                match data[0]:
+                    case 'v':
+                        vertices.append((float(data[1]), float(data[2]), float(data[3])))
+                    case 'p':
+                        data_objects[-1].add_points([self.resolve_index(int(v), vertex_offset + len(vertices))
+                                                     for v in data[1:]])
+                    case 'l':
+                        v_list = [self.resolve_index(int(vector_set.split('/')[0]), vertex_offset + len(vertices))
+                                  for vector_set in data[1:]]
+
+                        data_objects[-1].add_lines(list(zip(v_list[:-1], v_list[1:])))
+                    case 'f':
+                        # Apenas o índice do vértice importa (v, v/vt, v//vn ou v/vt/vn)
+                        v_list = [self.resolve_index(int(vector_set.split('/')[0]), vertex_offset + len(vertices))
+                                  for vector_set in data[1:]]
+
+                        data_objects[-1].add_lines(list(zip(v_list, v_list[1:] + v_list[:1])))
+                    case 'o':
+                        data_objects.append(ObjectData(data[1] if len(data) > 1 else ''))
+                    case _:
+                        pass
+
+        return np.array(vertices, dtype=np.float64).reshape(-1, 3), data_objects
+
+    @staticmethod
+    def join_continued_lines(obj_file: list[str]) -> Iterator[str]:
+        '''
+        Junta as linhas terminadas em "\\" com a linha seguinte.
+        '''
+
+        pending = ''
+
+        for line in obj_file:
+            stripped_line = line.rstrip()
+
+            if stripped_line.endswith('\\'):
+                pending += stripped_line[:-1] + ' '
+                continue
+
+            yield pending + line
+            pending = ''
+
+        if pending:
+            yield pending
+
+    @staticmethod
+    def find_line_boundary(buffer: bytearray) -> int:
+        '''
+        Retorna a posição logo após a última linha inteira do buffer, sem separar uma linha continuada com "\\"
+        da seguinte, ou 0 se não houver nenhuma.
+        '''
+
+        end = buffer.rfind(b'\n')
+
+        while end > 0 and buffer[max(end - 2, 0):end].rstrip(b'\r').endswith(b'\\'):
+            end = buffer.rfind(b'\n', 0, end)
+
+        return end + 1
+
+    def parse_obj_bulk(self,
+                       obj_file: bytes,
+                       vertex_offset: int = 0,
+                       continued: bool = False) -> tuple[np.ndarray, list[ObjectData]]:
+        '''
+        Lê um arquivo OBJ com operações em bloco do NumPy, retornando a tabela de vértices (N, 3) e os
+        descritores de objetos.
+
+        As linhas são classificadas pelos dois primeiros bytes e cada sequência de linhas do mesmo tipo é
+        convertida de uma vez com np.fromstring. Nos elementos (f, l, p), a palavra-chave vira um 0, que não é
+        um índice válido no OBJ e marca o início de cada registro. Sintaxe fora do comum (vértices com w ou
+        cor, comentários no fim da linha, continuação de linha) gera ValueError. Os índices, continued e os
+        elementos antes do primeiro objeto funcionam como em parse_obj_lines.
+        '''
+
+        buffer = np.frombuffer(obj_file, dtype=np.uint8)
+        line_starts = np.concatenate(([0], np.flatnonzero(buffer == ord('\n')) + 1))
+        line_starts = line_starts[line_starts < len(buffer)]
+        line_ends = np.append(line_starts[1:], len(buffer))
+
+        padded_buffer = np.append(buffer, np.zeros(2, dtype=np.uint8))
+        first_bytes = padded_buffer[line_starts]
+        second_bytes = padded_buffer[line_starts + 1]
+
+        if np.any(np.isin(first_bytes, (ord(' '), ord('\t')))) or b'\\\n' in obj_file or b'\\\r\n' in obj_file:
+            raise ValueError('Unsupported OBJ syntax for the bulk parser')
+
+        # Tipo de cada linha: o primeiro byte quando ele é seguido de um espaço, senão 0; um "o" sozinho na
+        # linha também começa um objeto
+        is_keyword = np.isin(second_bytes, (ord(' '), ord('\t'))) | \
+            ((first_bytes == ord('o')) & np.isin(second_bytes, (ord('\n'), ord('\r'), 0)))
+        line_kinds = np.where(is_keyword, first_bytes, 0)
+        is_vertex = line_kinds == ord('v')
+        is_object = line_kinds == ord('o')
+        objects_before = np.cumsum(is_object)
+
+        # Elementos antes do primeiro "o" ficam em um descritor inicial
+        is_element = np.isin(line_kinds, (ord('f'), ord('l'), ord('p')))
+        has_leading_object = continued or bool(np.any(is_element & (objects_before == 0)))
+
+        vertices_before = np.cumsum(is_vertex) + vertex_offset
+        line_objects = objects_before - (0 if has_leading_object else 1)
+
+        data_objects = [ObjectData('')] if has_leading_object else []
+        data_objects += [ObjectData(b''.join(obj_file[start:end].split()[1:2]).decode('utf-8'))
+                         for start, end in zip(line_starts[is_object], line_ends[is_object])]
+
+        attributes_prefix = ObjParser.ATTRIBUTES_PREFIX.encode('utf-8')
+
+        for line in np.flatnonzero((first_bytes == ord('#')) & (second_bytes == ord('s'))):
+            if obj_file.startswith(attributes_prefix, line_starts[line]) and line_objects[line] >= 0:
+                attributes = obj_file[line_starts[line] + len(attributes_prefix):line_ends[line]]
+                data_objects[line_objects[line]].attributes = json.loads(attributes)
+
+        vertex_chunks = []
+        record_chunks = []
+
+        run_starts = np.flatnonzero(np.diff(line_kinds, prepend=-1) != 0)
+        run_ends = np.append(run_starts[1:], len(line_kinds))
+
+        for first_line, end_line in zip(run_starts, run_ends):
+            kind = bytes([line_kinds[first_line]])
+            chunk = obj_file[line_starts[first_line]:line_ends[end_line - 1]]
+            line_count = end_line - first_line
+
+            if kind == b'v':
+                values = self.parse_numbers(chunk.replace(b'v', b' '), np.float64)
+
+                if len(values) != 3 * line_count:
+                    raise ValueError('Unsupported vertex record')
+
+                vertex_chunks.append(values.reshape(-1, 3))
+            elif kind in (b'f', b'l', b'p'):
+                values = self.parse_numbers(self.strip_element_chunk(chunk, kind), np.int64)
+                record_starts = np.flatnonzero(values == 0)
+
+                if len(record_starts) != line_count:
+                    raise ValueError('Unsupported element record')
+
+                record_chunks.append((kind, values, record_starts, np.arange(first_line, end_line)))
+
+        vertices = np.concatenate(vertex_chunks) if vertex_chunks else np.empty((0, 3))
+
+        for kind, values, record_starts, record_lines in record_chunks:
+            self.add_bulk_records(kind, values, record_starts, record_lines, vertices_before, line_objects,
+                                  vertex_offset + len(vertices), data_objects)
+
+        return vertices, data_objects
+
+    @staticmethod
+    def strip_element_chunk(chunk: bytes, kind: bytes) -> bytes:
+        '''
+        Prepara um bloco de registros de elementos para a conversão: a palavra-chave vira 0 e as referências
+        de textura e normal (o que vem depois da primeira barra de cada canto) viram espaços.
+        '''
+
+        characters = np.frombuffer(chunk, dtype=np.uint8).copy()
+
+        # Apenas o índice do vértice importa (v, v/vt, v//vn ou v/vt/vn)
+        if b'/' in chunk:
+            slash_count = np.cumsum(characters == ord('/'), dtype=np.int32)
+            slashes_before_corner = np.maximum.accumulate(np.where(characters <= ord(' '), slash_count, 0))
+            characters[slash_count > slashes_before_corner] = ord(' ')
+
+        characters[characters == ord(kind)] = ord('0')
+
+        return characters.tobytes()
+
+    @staticmethod
+    def parse_numbers(chunk: bytes, dtype: type) -> np.ndarray:
+        '''
+        Converte um bloco de números separados por espaços em um array, gerando ValueError se algum não for
+        um número.
+        '''
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+
+            try:
+                return np.fromstring(chunk, dtype=dtype, sep=' ')
+            except DeprecationWarning as error:
+                raise ValueError('Unsupported OBJ record') from error
+
+    @staticmethod
+    def add_bulk_records(kind: bytes,
+                         values: np.ndarray,
+                         record_starts: np.ndarray,
+                         record_lines: np.ndarray,
+                         vertices_before: np.ndarray,
+                         line_objects: np.ndarray,
+                         vertex_count: int,
+                         data_objects: list[ObjectData]) -> None:
+        '''
+        Converte uma sequência de registros f, l ou p lida em bloco em linhas e pontos dos objetos.
+        '''
+
+        counts = np.diff(np.append(record_starts, len(values))) - 1
+        is_index = values != 0
+        corner_records = np.repeat(np.arange(len(counts)), counts)
+
+        # Índices negativos são relativos ao número de vértices lidos até o registro
+        corner_indices = values[is_index]
+        corner_indices = np.where(corner_indices > 0,
+                                  corner_indices - 1,
+                                  vertices_before[record_lines][corner_records] + corner_indices)
+
+        if np.any((corner_indices < 0) | (corner_indices >= vertex_count)):
+            raise ValueError('Vertex index out of range')
+
+        corner_objects = line_objects[record_lines][corner_records]
+
+        if kind == b'p':
+            lines = np.empty((0, 2), dtype=np.int64)
+            line_objects_ = np.empty(0, dtype=np.int64)
+            points = corner_indices
+            point_objects = corner_objects
+        else:
+            # Cada canto liga ao seguinte; faces fecham no primeiro canto e polilinhas não fecham
+            starts = np.cumsum(counts) - counts
+            ends = starts[counts > 0] + counts[counts > 0] - 1
+            following = np.arange(len(corner_indices)) + 1
+            is_edge = np.ones(len(corner_indices), dtype=bool)
+
+            if kind == b'f':
+                following[ends] = starts[counts > 0]
+            else:
+                is_edge[ends] = False
+                following[ends] = ends
+
+            lines = np.stack((corner_indices[is_edge], corner_indices[following[is_edge]]), axis=1)
+            line_objects_ = corner_objects[is_edge]
+            points = np.empty(0, dtype=np.int64)
+            point_objects = np.empty(0, dtype=np.int64)
+
+        # Separação por objeto mantendo a ordem do arquivo
+        for index in np.unique(np.concatenate((line_objects_, point_objects))):
+            data_objects[index].add_lines(lines[line_objects_ == index])
+            data_objects[index].add_points(points[point_objects == index])
+
+
+class VertexTable():
+
+    '''
+    Tabela de vértices (N, 3) do arquivo, que cresce por blocos com capacidade dobrada.
+    '''
+
+    _vertices: np.ndarray
+    _count: int
+
+    def __init__(self) -> None:
+        self._vertices = np.empty((1024, 3))
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def array(self) -> np.ndarray:
+        '''
+        Retorna os vértices lidos até agora, sem cópia.
+        '''
+
+        return self._vertices[:self._count]
+
+    def append(self, vertices: np.ndarray) -> None:
+        '''
+        Adiciona um bloco de vértices (M, 3).
+        '''
+
+        required = self._count + len(vertices)
+
+        if required > len(self._vertices):
+            grown = np.empty((max(required, 2 * len(self._vertices)), 3))
+            grown[:self._count] = self.array
+            self._vertices = grown
+
+        self._vertices[self._count:required] = vertices
+        self._count = required
+
+
+class ObjectData():
+
+    '''
+    Descritor de objetos.
+
+    As linhas e os pontos guardam índices da tabela de vértices do arquivo; o objeto recebe apenas os vértices
+    que usa, uma vez cada.
+    '''
+
+    removed_line_count: int
+    attributes: dict | None
+    points: list[int | np.ndarray]
+    lines: list[tuple[int, int] | np.ndarray]
+
+    _name: str
+    _material: tuple[float]
+    _used_indices: np.ndarray | None
+    _local_lines: np.ndarray | None
+
+    def __init__(self, name: str) -> None:
+        self.removed_line_count = 0
+        self.attributes = None
+        self.points = []
+        self.lines = []
+        self._name = name
+        self._material = (1.0, 1.0, 1.0)
+        self._used_indices = None
+        self._local_lines = None
+
+    def add_points(self, points: list[int] | np.ndarray) -> None:
+        '''
+        Adiciona pontos isolados, uma lista de índices ou um array (N,).
+        '''
+
+        if isinstance(points, np.ndarray):
+            self.points.append(points)
+        else:
+            self.points += points
+
+    def add_lines(self, lines: list[tuple[int, int]] | np.ndarray) -> None:
+        '''
+        Adiciona linhas, uma lista de pares de índices ou um array (E, 2).
+        '''
+
+        if isinstance(lines, np.ndarray):
+            self.lines.append(lines)
+        else:
+            self.lines += lines
+
+    @property
+    def is_empty(self) -> bool:
+        '''
+        Verifica se o descritor não tem linhas nem pontos.
+        '''
+
+        return all(np.size(item) == 0 for item in self.lines + self.points)
+
+    def extend(self, other: ObjectData) -> None:
+        '''
+        Adiciona as linhas e os pontos de outro descritor, que continua este objeto em outro trecho do arquivo.
+        '''
+
+        self.points += other.points
+        self.lines += other.lines
+
+        if other.attributes is not None:
+            self.attributes = other.attributes
+
+    def add_material(self, material: tuple[float]) -> None:
+        '''
+        Adiciona um material.
+        '''
+
+        self._material = material
+
+    @staticmethod
+    def concatenate(items: list, width: int) -> np.ndarray:
+        '''
+        Junta uma lista de índices soltos e arrays de índices em um único array (N, width), mantendo a ordem.
+        '''
+
+        arrays = []
+        loose = []
+
+        for item in items:
+            if isinstance(item, np.ndarray):
+                arrays.append(np.array(loose, dtype=np.int64).reshape(-1, width))
+                arrays.append(item.reshape(-1, width))
+                loose = []
+            else:
+                loose.append(item)
+
+        arrays.append(np.array(loose, dtype=np.int64).reshape(-1, width))
+
+        return np.concatenate(arrays).astype(np.int64)
+
+    def deduplicate_lines(self) -> np.ndarray:
+        '''
+        Remove as arestas repetidas, comparando os pares não direcionados de índices do arquivo.
+
+        Em uma malha, cada aresta interna aparece em duas faces; só a primeira ocorrência é mantida.
+        '''
+
+        lines = self.concatenate(self.lines, 2)
+        _, first_indices = np.unique(np.sort(lines, axis=1), axis=0, return_index=True)
+
+        self.removed_line_count = len(lines) - len(first_indices)
+
+        return lines[np.sort(first_indices)]
+
+    def prepare(self) -> None:
+        '''
+        Remove as linhas repetidas e remapeia os índices do arquivo para os vértices do objeto.
+
+        Só depende dos índices, então pode ser feito pelo processo que leu o objeto, antes da tabela de vértices
+        estar completa. Depois disso, o descritor não aceita mais elementos.
+        '''
+
+        if self._used_indices is not None:
+            return
+
+        lines = self.deduplicate_lines()
+        file_indices = np.concatenate((lines.ravel(), self.concatenate(self.points, 1).ravel()))
+        self._used_indices, local_indices = np.unique(file_indices, return_inverse=True)
+        self._local_lines = local_indices[:lines.size].reshape(-1, 2)
+        self.points = []
+        self.lines = []
+
+    def build_object(self, vertex_table: np.ndarray) -> Object:
+        '''
+        Processa os dados e gera um objeto com os vértices que ele usa, com os atributos gravados no arquivo, se
+        houver.
+        '''
+
+        self.prepare()
+        coords = Matrix.to_homogeneous(vertex_table[self._used_indices])
+
+        if self.attributes is not None:
+            return SceneIO.restore_object(self.attributes, coords, self._local_lines)
+
+        return Wireframe3D(coords, self._local_lines, self._name)
@@ -0,0 +1,276 @@
+'''
+Módulo para a leitura de arquivos OBJ em blocos, em sequência ou em paralelo.
+'''
+
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import TYPE_CHECKING, Iterator
+import multiprocessing
+
+import numpy as np
+
+from source.backend.load_statistics import LoadStatistics
+from source.backend.obj_parser import ObjParser, ObjectData, VertexTable
+from source.backend.objects.object import Object
+
+if TYPE_CHECKING:
+    from threading import Event
+
+
+class ObjReader():
+
+    '''
+    Leitor de arquivos OBJ que gera cada objeto assim que ele termina, atualizando as estatísticas da leitura.
+
+    Este módulo não importa o GTK, já que os processos da leitura paralela são criados a partir dele.
+    '''
+
+    CHUNK_SIZE: int = 1 << 24
+    CHUNKS_PER_WORKER: int = 2
+
+    statistics: LoadStatistics
+
+    def __init__(self, statistics: LoadStatistics) -> None:
+        self.statistics = statistics
+
+    @staticmethod
+    def is_cancelled(cancel_event: Event | None) -> bool:
+        '''
+        Verifica se a leitura foi cancelada.
+        '''
+
+        return cancel_event is not None and cancel_event.is_set()
+
+    def iter_blocks(self, file_name: str, block_size: int, cancel_event: Event | None = None) -> Iterator[Object]:
+        '''
+        Lê um arquivo em sequência, em blocos de bytes.
+
+        As linhas inteiras de cada bloco são processadas e liberadas, mesmo no meio de um objeto; os elementos
+        lidos vão para o último objeto aberto, que só é gerado quando o próximo "o" ou o fim do arquivo o encerra.
+        Só a tabela de vértices do arquivo e os índices dos objetos abertos crescem com a leitura, já que faces
+        podem referenciar vértices de objetos anteriores.
+        '''
+
+        vertex_table = VertexTable()
+        open_objects = []
+        pending = bytearray()
+
+        with open(file_name, 'rb') as file:
+            while True:
+                if self.is_cancelled(cancel_event):
+                    return
+
+                block = file.read(block_size)
+                self.statistics.read_byte_count += len(block)
+                pending += block
+
+                boundary = ObjParser.find_line_boundary(pending) if block else len(pending)
+
+                if boundary > 0:
+                    vertices, data_objects = ObjParser().parse_bytes(bytes(pending[:boundary]), len(vertex_table), True)
+                    del pending[:boundary]
+
+                    yield from self.stitch_objects(vertices, data_objects, vertex_table, open_objects)
+
+                if not block:
+                    break
+
+        for data_obj in open_objects:
+            yield self.build_object(data_obj, vertex_table)
+
+    def stitch_objects(self,
+                       vertices: np.ndarray,
+                       data_objects: list[ObjectData],
+                       vertex_table: VertexTable,
+                       open_objects: list[ObjectData]) -> Iterator[Object]:
+        '''
+        Junta um trecho lido com continued aos anteriores, gerando os objetos que ele encerra.
+
+        Os elementos antes do primeiro "o" do trecho continuam o último objeto aberto; o último objeto do trecho
+        fica em open_objects, já que pode continuar no próximo.
+        '''
+
+        vertex_table.append(vertices)
+        continuation, *segment_objects = data_objects
+
+        if open_objects:
+            open_objects[-1].extend(continuation)
+        elif not continuation.is_empty:
+            open_objects.append(continuation)
+
+        open_objects += segment_objects
+        closed_objects = open_objects[:-1]
+        del open_objects[:-1]
+
+        for data_obj in closed_objects:
+            yield self.build_object(data_obj, vertex_table)
+
+    def build_object(self, data_obj: ObjectData, vertex_table: VertexTable) -> Object:
+        '''
+        Gera o objeto de um descritor, contabilizando-o nas estatísticas.
+        '''
+
+        obj = data_obj.build_object(vertex_table.array)
+
+        self.statistics.object_count += 1
+        self.statistics.vertex_count += len(obj.projected_coords)
+        self.statistics.edge_count += len(obj.lines)
+        self.statistics.removed_edge_count += data_obj.removed_line_count
+
+        return obj
+
+    def iter_chunks(self,
+                    file_name: str,
+                    file_size: int,
+                    worker_count: int,
+                    cancel_event: Event | None = None) -> Iterator[Object]:
+        '''
+        Lê um arquivo em paralelo, em pedaços divididos no fim de linhas e processados por um pool de processos.
+
+        Uma primeira passada conta os vértices de cada pedaço, o que dá o número de vértices antes de cada um;
+        na segunda, cada pedaço é lido com esse deslocamento, então os índices (inclusive os negativos) já saem
+        globais. Uma contagem errada não interrompe a leitura: os pedaços seguintes são relidos com o deslocamento
+        corrigido. Só CHUNKS_PER_WORKER pedaços por processo ficam em andamento, então os resultados ainda não
+        consumidos não se acumulam na memória. Eles são costurados em ordem: os elementos antes do primeiro "o" de
+        um pedaço continuam o último objeto do anterior, e cada objeto é gerado quando o pedaço seguinte o encerra.
+        '''
+
+        chunks = self.split_chunks(file_name, file_size, max(worker_count, -(-file_size // ObjReader.CHUNK_SIZE)))
+        starts, ends = zip(*chunks)
+
+        # Os processos são criados do zero, já que o programa principal tem threads (GTK e carregamento)
+        executor = ProcessPoolExecutor(worker_count, mp_context=multiprocessing.get_context('spawn'))
+
+        try:
+            vertex_counts = list(executor.map(self.count_chunk_vertices, repeat(file_name), starts, ends))
+            arguments = iter(zip(starts, ends, vertex_counts))
+            next_offset = 0
+            futures = deque()
+
+            vertex_table = VertexTable()
+            open_objects = []
+
+            while True:
+                if self.is_cancelled(cancel_event):
+                    return
+
+                for start, end, vertex_count in arguments:
+                    futures.append([start,
+                                    end,
+                                    next_offset,
+                                    vertex_count,
+                                    executor.submit(self.parse_chunk, file_name, start, end, next_offset)])
+                    next_offset += vertex_count
+
+                    if len(futures) >= worker_count * ObjReader.CHUNKS_PER_WORKER:
+                        break
+
+                if not futures:
+                    break
+
+                start, end, _, vertex_count, future = futures.popleft()
+                vertices, data_objects = future.result()
+                correction = len(vertices) - vertex_count
+
+                # Se a contagem divergir do leitor, os pedaços seguintes já enviados são relidos com o deslocamento
+                # corrigido, já que os índices negativos deles dependem dele
+                if correction != 0:
+                    next_offset += correction
+
+                    for pending in futures:
+                        pending[4].cancel()
+                        pending[2] += correction
+                        pending[4] = executor.submit(self.parse_chunk, file_name, pending[0], pending[1], pending[2])
+
+                self.statistics.read_byte_count += end - start
+
+                yield from self.stitch_objects(vertices, data_objects, vertex_table, open_objects)
+
+            for data_obj in open_objects:
+                yield self.build_object(data_obj, vertex_table)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def split_chunks(file_name: str, file_size: int, chunk_count: int) -> list[tuple[int, int]]:
+        '''
+        Divide um arquivo em até chunk_count pedaços (início, fim) de tamanhos próximos, terminados em linhas
+        inteiras.
+        '''
+
+        boundaries = [0]
+
+        with open(file_name, 'rb') as file:
+            for i in range(1, chunk_count):
+                # Voltar um byte garante que um início de linha exato seja mantido como divisão
+                file.seek(max(file_size * i // chunk_count - 1, boundaries[-1]))
+                file.readline()
+
+                # Linhas continuadas com "\\" não são separadas da seguinte; como em ObjParser.find_line_boundary, o
+                # fim da linha é olhado antes da quebra, já que a linha lida pode ser só o fim de uma linha anterior
+                while 0 < file.tell() < file_size:
+                    end = file.tell()
+                    file.seek(max(end - 3, 0))
+
+                    if not file.read(end - 1 - file.tell()).rstrip(b'\r').endswith(b'\\'):
+                        file.seek(end)
+                        break
+
+                    file.seek(end)
+                    file.readline()
+
+                if file.tell() < file_size and file.tell() > boundaries[-1]:
+                    boundaries.append(file.tell())
+
+        boundaries.append(file_size)
+
+        return list(zip(boundaries[:-1], boundaries[1:]))
+
+    @staticmethod
+    def read_chunk(file_name: str, start: int, end: int) -> bytes:
+        '''
+        Lê um pedaço de um arquivo.
+        '''
+
+        with open(file_name, 'rb') as file:
+            file.seek(start)
+
+            return file.read(end - start)
+
+    @staticmethod
+    def count_chunk_vertices(file_name: str, start: int, end: int) -> int:
+        '''
+        Conta os registros de vértice de um pedaço, com a mesma regra dos leitores.
+        '''
+
+        chunk = ObjReader.read_chunk(file_name, start, end)
+
+        # Linhas com espaços no início ou continuadas com "\\" só são aceitas pelo leitor linha a linha, então são
+        # contadas como ele as lê
+        if chunk[:1] in (b' ', b'\t') or b'\n ' in chunk or b'\n\t' in chunk or b'\\' in chunk:
+            lines = ObjParser.join_continued_lines(chunk.decode('utf-8').splitlines())
+
+            return sum(1 for line in lines if line.split('#', 1)[0].split()[:1] == ['v'])
+
+        chunk = b'\n' + chunk
+
+        return chunk.count(b'\nv ') + chunk.count(b'\nv\t')
+
+    @staticmethod
+    def parse_chunk(file_name: str, start: int, end: int, vertex_offset: int) -> tuple[np.ndarray, list[ObjectData]]:
+        '''
+        Lê um pedaço de um arquivo em um processo do pool. O primeiro descritor retornado guarda os elementos
+        que vêm antes do primeiro "o" do pedaço, e o último pode continuar no pedaço seguinte.
+        '''
+
+        vertices, data_objects = ObjParser().parse_bytes(ObjReader.read_chunk(file_name, start, end),
+                                                         vertex_offset,
+                                                         True)
+
+        # Os objetos que começam e terminam no pedaço já são preparados aqui, em paralelo
+        for data_obj in data_objects[1:-1]:
+            data_obj.prepare()
+
+        return vertices, data_objects
@@ -0,0 +1,83 @@
+'''
+Módulo para a escrita de arquivos OBJ.
+'''
+
+import json
+import os
+
+import numpy as np
+
+from source.backend.obj_parser import ObjParser
+from source.backend.objects.object import Object
+from source.backend.scene_io import SceneIO
+
+
+class ObjWriter():
+
+    '''
+    Escritor de arquivos OBJ.
+    '''
+
+    @staticmethod
+    def write(file_name: str, objects: list[Object]) -> None:
+        '''
+        Escreve um arquivo OBJ com as coordenadas de mundo dos objetos.
+
+        Cada objeto é formatado em bloco e escrito de uma vez; o arquivo é escrito em um temporário e renomeado.
+        '''
+
+        temporary_path = file_name + '.tmp'
+        vertex_offset = 1
+
+        try:
+            with open(temporary_path, 'w', encoding='utf-8') as file:
+                for i, obj in enumerate(objects):
+                    file.write(ObjWriter.format_object(obj, f'Object{i}', vertex_offset))
+                    vertex_offset += len(obj.coords)
+
+            os.replace(temporary_path, file_name)
+        except BaseException:
+            SceneIO.discard_file(temporary_path)
+            raise
+
+    @staticmethod
+    def format_records(keyword: str, values: np.ndarray, value_format: str) -> str:
+        '''
+        Formata um array (N, M) como N registros OBJ com uma única operação de formatação.
+        '''
+
+        if values.size == 0:
+            return ''
+
+        record = keyword + (' ' + value_format) * values.shape[1] + '\n'
+
+        return (record * len(values)) % tuple(values.ravel().tolist())
+
+    @staticmethod
+    def format_object(obj: Object, default_name: str, vertex_offset: int) -> str:
+        '''
+        Formata um objeto como registros o, v e l, f ou p, com índices globais a partir de vertex_offset.
+
+        Os vértices usam 17 dígitos significativos, então voltam exatamente iguais na leitura. Polígonos
+        preenchidos viram uma face; vértices sem linhas viram pontos, para não serem descartados na leitura. O
+        nome no registro "o" não tem espaços; o nome original, a classe, a cor, a espessura, o preenchimento e o
+        fechamento vão em um comentário "#sgi" com JSON, que outros leitores ignoram e o nosso lê de volta.
+        '''
+
+        lines = obj.lines
+        name = '_'.join(obj.name.split()) or default_name
+        records = [f'o {name}\n',
+                   ObjParser.ATTRIBUTES_PREFIX + json.dumps(SceneIO.object_attributes(obj)) + '\n',
+                   ObjWriter.format_records('v', obj.coords[:, :3], '%.17g')]
+
+        is_ring = len(lines) > 0 and lines[-1, 1] == lines[0, 0] and np.array_equal(lines[1:, 0], lines[:-1, 1])
+
+        if obj.fill and is_ring:
+            records.append(ObjWriter.format_records('f', lines[np.newaxis, :, 0] + vertex_offset, '%d'))
+        else:
+            records.append(ObjWriter.format_records('l', lines + vertex_offset, '%d'))
+
+        unused_indices = np.setdiff1d(np.arange(len(obj.coords)), lines)
+        records.append(ObjWriter.format_records('p', unused_indices[np.newaxis] + vertex_offset, '%d'))
+
+        return ''.join(records)
@@ -2,10 +2,19 @@
 Objeto.
 '''
 
+from __future__ import annotations
 from enum import Enum
+from typing import TYPE_CHECKING, Callable
 
+import numpy as np
+
+from source.backend.math.matrix import Matrix
 from source.backend.math.transform import Transform
 from source.backend.math.vector import Vector
+from source.backend.rendering.homogeneous_clipper import HomogeneousClipper
+
+if TYPE_CHECKING:
+    from source.backend.rendering.frame_context import FrameContext
 
 
 class ObjectType(Enum):
@@ -39,24 +48,34 @@ class Object():
     fill: bool
     closed: bool
     object_type: ObjectType
-    coords: list[Vector]
-    normalized_coords: list[Vector]
-    projected_coords: list[Vector]
-    lines: list[tuple[int, int]]
-    vector_lines: list[tuple[Vector, Vector]]
+    projected_coords: np.ndarray
+    lines: np.ndarray
+    vector_lines: np.ndarray
+    inside_lines: np.ndarray
+    on_transform: Callable[[Object], None] | None
 
     _transform: Transform
+    _local_coords: np.ndarray
+    _local_radius: float
+    _local_box_center: np.ndarray
+    _local_box_half: np.ndarray
+    _coords: np.ndarray | None
+    _bounding_sphere: tuple[np.ndarray, float] | None
+    _bounding_box: tuple[np.ndarray, np.ndarray] | None
+    _bounds_version: int
+    _frame_key: tuple[FrameContext, int] | None
 
     def __init__(self,
-                 coords: tuple[Vector],
+                 coords: tuple[Vector] | np.ndarray,
                  lines: tuple[tuple[int, int]],
                  name: str,
                  color: tuple,
                  line_width: float,
                  object_type: ObjectType,
                  fill: bool,
-                 closed: bool) -> None:
-
+                 closed: bool,
+                 model_matrix: np.ndarray | None = None,
+                 local_bounds: tuple[float, np.ndarray, np.ndarray] | None = None) -> None:
         super().__init__()
         self.name = name
         self.color = color
@@ -64,14 +83,86 @@ class Object():
         self.fill = fill
         self.closed = closed
         self.object_type = object_type
-        self.coords = list(coords)
-        self.normalized_coords = coords
-        self.projected_coords = coords
-        self._transform = Transform(self.calculate_center())
-        self.lines = list(lines)
-        self.vector_lines = []
 
-        self.generate_vector_lines()
+        # Com uma matriz de modelo, as coordenadas (N, 4) já são locais e são usadas sem cópia (podem ser um mapa
+        # de arquivo); os limites locais dados evitam percorrer os vértices na construção
+        if model_matrix is None:
+            self._coords = coords if isinstance(coords, np.ndarray) else Vector.stack(coords)
+            self._transform = Transform(self.calculate_center())
+
+            # Geometria base imutável, centrada na origem; a posição fica na matriz de modelo
+            self._local_coords = Matrix.multiply_vectors(Matrix.build_translation_matrix(-self.position),
+                                                         self._coords)
+            self.projected_coords = self._coords
+        else:
+            self._coords = None
+            self._transform = Transform.from_matrix(model_matrix)
+            self._local_coords = coords
+            self.projected_coords = coords
+
+        self._local_coords.flags.writeable = False
+
+        if local_bounds is None:
+            self._local_radius = float(np.max(np.linalg.norm(self._local_coords[:, :3], axis=1), initial=0.0))
+            local_lower = self._local_coords[:, :3].min(axis=0, initial=0.0)
+            local_upper = self._local_coords[:, :3].max(axis=0, initial=0.0)
+            self._local_box_center = (local_lower + local_upper) * 0.5
+            self._local_box_half = (local_upper - local_lower) * 0.5
+        else:
+            self._local_radius, self._local_box_center, self._local_box_half = local_bounds
+
+        self._bounding_sphere = None
+        self._bounding_box = None
+        self._bounds_version = -1
+
+        self.lines = np.asarray(lines, dtype=np.int64).reshape(-1, 2)
+        self.vector_lines = np.empty((0, 2, 2))
+        self.inside_lines = np.empty(0, dtype=bool)
+        self._frame_key = None
+        self.on_transform = None
+
+    @property
+    def coords(self) -> np.ndarray:
+        '''
+        Retorna as coordenadas de mundo, aplicando a matriz de modelo apenas quando necessário.
+        '''
+
+        if self._coords is None:
+            self._coords = Matrix.multiply_vectors(self._transform.matrix, self._local_coords)
+
+        return self._coords
+
+    @property
+    def local_coords(self) -> np.ndarray:
+        '''
+        Retorna as coordenadas locais (N, 4), somente leitura.
+        '''
+
+        return self._local_coords
+
+    @property
+    def local_bounds(self) -> tuple[float, np.ndarray, np.ndarray]:
+        '''
+        Retorna os limites locais: raio, centro e meia extensão da caixa.
+        '''
+
+        return self._local_radius, self._local_box_center, self._local_box_half
+
+    @property
+    def model_matrix(self) -> np.ndarray:
+        '''
+        Retorna a matriz de modelo.
+        '''
+
+        return self._transform.matrix
+
+    @property
+    def version(self) -> int:
+        '''
+        Retorna a versão do objeto, que muda a cada transformação.
+        '''
+
+        return self._transform.version
 
     @property
     def position(self) -> Vector:
@@ -97,17 +188,57 @@ class Object():
 
         return self._transform.scale
 
-    def calculate_center(self) -> Vector:
+    @property
+    def bounding_sphere(self) -> tuple[np.ndarray, float]:
+        '''
+        Retorna a esfera envolvente de mundo (centro (3,), raio).
+        '''
+
+        self._update_bounds()
+
+        return self._bounding_sphere
+
+    @property
+    def bounding_box(self) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Retorna a caixa envolvente de mundo alinhada aos eixos (mínimo (3,), máximo (3,)).
+        '''
+
+        self._update_bounds()
+
+        return self._bounding_box
+
+    def _update_bounds(self) -> None:
         '''
-        Retorna o centro do objeto.
+        Refaz os volumes envolventes de mundo apenas quando a transformada muda.
+
+        A geometria local é centrada na origem, então o centro da esfera é a translação da matriz de modelo e o
+        raio local é multiplicado pelo maior fator de escala. A caixa local é levada ao mundo pelo valor
+        absoluto da parte linear da matriz.
         '''
 
-        coord_sum = Vector(0.0, 0.0, 0.0)
+        if self._bounding_sphere is not None and self._bounds_version == self.version:
+            return
+
+        matrix = self._transform.matrix
+        linear = matrix[:3, :3]
+        max_scale = np.max(np.linalg.norm(linear, axis=0))
+        box_center = linear @ self._local_box_center + matrix[:3, 3]
+        box_half = np.abs(linear) @ self._local_box_half
+
+        self._bounding_sphere = (matrix[:3, 3].copy(), self._local_radius * max_scale)
+        self._bounding_box = (box_center - box_half, box_center + box_half)
+        self._bounds_version = self.version
+
+    def calculate_center(self) -> Vector:
+        '''
+        Retorna o centro do objeto, ou a origem se ele não tiver vértices.
+        '''
 
-        for coord in self.coords:
-            coord_sum += coord
+        if len(self.coords) == 0:
+            return Vector(0.0, 0.0, 0.0)
 
-        return coord_sum / len(self.coords)
+        return Vector.from_array(self.coords.mean(axis=0))
 
     # Métodos de transformação
     def translate(self, direction: Vector) -> None:
@@ -115,52 +246,126 @@ class Object():
         Método para transladar o objeto.
         '''
 
-        self.coords = self._transform.translate(direction, self.coords)
+        self._transform.translate(direction)
+        self._coords = None
+        self._notify_transform()
 
     def rotate(self, rotation: Vector, origin: Vector | None = None) -> None:
         '''
         Transformação de rotação.
         '''
 
-        self.coords = self._transform.rotate(rotation, self.coords, origin)
+        self._transform.rotate(rotation, origin)
+        self._coords = None
+        self._notify_transform()
 
     def rescale(self, scale: Vector) -> None:
         '''
         Transformação de escala.
         '''
 
-        self.coords = self._transform.rescale(scale, self.coords)
+        self._transform.rescale(scale)
+        self._coords = None
+        self._notify_transform()
 
-    def normalize(self, window_center: Vector, window_scale: Vector, window_rotation: float) -> None:
+    def _notify_transform(self) -> None:
         '''
-        Normaliza as coordenadas.
+        Avisa o ouvinte registrado (por exemplo, o índice espacial da cena) que o objeto foi transformado.
         '''
 
-        diff_x = 1.0 / window_scale.x
-        diff_y = 1.0 / window_scale.y
-        diff_z = 1.0 / window_scale.z
+        if self.on_transform is not None:
+            self.on_transform(self)
 
-        self.normalized_coords = self._transform.normalize(window_center,
-                                                           window_rotation,
-                                                           Vector(diff_x, diff_y, diff_z),
-                                                           self.projected_coords)
+    def is_outdated(self, frame_context: FrameContext) -> bool:
+        '''
+        Verifica se as coordenadas projetadas e normalizadas precisam ser refeitas para o frame.
+        '''
+
+        return self._frame_key != (frame_context, self.version)
+
+    def is_visible(self, frame_context: FrameContext) -> bool:
+        '''
+        Verifica se a esfera envolvente intercepta o volume de visão do frame.
+        '''
+
+        center, radius = self.bounding_sphere
+
+        return bool(np.all(frame_context.view_planes[:, :3] @ center + frame_context.view_planes[:, 3] >= -radius))
 
-    def project(self, cop: Vector, normal: Vector, cop_distance: float) -> None:
+    def cull(self, frame_context: FrameContext) -> None:
         '''
-        Gera as coordenadas de projeção.
+        Descarta o objeto no frame sem processar os vértices.
         '''
 
-        self.projected_coords = self._transform.project(cop, normal, cop_distance, self.coords)
+        self.vector_lines = np.empty((0, 2, 2))
+        self.inside_lines = np.empty(0, dtype=bool)
+        self._frame_key = (frame_context, self.version)
 
-    def generate_vector_lines(self) -> None:
+    def project(self, frame_context: FrameContext) -> None:
         '''
-        Gera as linhas com vetores.
+        Gera as coordenadas de projeção com a transformação compartilhada do frame.
+
+        A matriz de modelo é combinada com a do frame, então as coordenadas de mundo não são calculadas.
         '''
 
-        self.vector_lines.clear()
+        transformation = frame_context.transformation @ self._transform.matrix
+        self.projected_coords = Matrix.multiply_vectors(transformation, self._local_coords)
+        self._frame_key = (frame_context, self.version)
+
+    def normalize(self, frame_context: FrameContext) -> None:
+        '''
+        Gera as linhas normalizadas (E, 2, 2) a partir das coordenadas projetadas.
+
+        As arestas são recortadas em coordenadas homogêneas antes da divisão de perspectiva; polígonos
+        preenchidos são recortados como um anel para continuarem fechados.
+        '''
+
+        if self.fill:
+            ring_indices = self.lines[:, 0]
+
+            if len(self.lines) > 0 and self.lines[-1, 1] != self.lines[0, 0]:
+                ring_indices = np.append(ring_indices, self.lines[-1, 1])
+
+            ring = HomogeneousClipper.clip_ring(self.projected_coords[ring_indices], frame_context.window_planes)
+
+            self.vector_lines = np.stack((ring, np.roll(ring, -1, axis=0)), axis=1)
+            self.inside_lines = np.zeros(len(ring), dtype=bool)
+        else:
+            self.vector_lines, self.inside_lines = HomogeneousClipper.clip_lines(self.projected_coords[self.lines],
+                                                                                 frame_context.window_planes)
+
+    def distance_to(self, point: np.ndarray) -> float:
+        '''
+        Retorna a menor distância entre um ponto normalizado (2,) e as linhas normalizadas do objeto, que é zero
+        para pontos dentro de um objeto preenchido.
+        '''
+
+        if len(self.vector_lines) == 0:
+            return np.inf
+
+        if self.fill and self.contains(point):
+            return 0.0
+
+        start = self.vector_lines[:, 0]
+        delta = self.vector_lines[:, 1] - start
+        length_squared = np.einsum('ij,ij->i', delta, delta)
+        length_squared[length_squared == 0.0] = 1.0
+        t = np.clip(np.einsum('ij,ij->i', point - start, delta) / length_squared, 0.0, 1.0)
+
+        return float(np.min(np.linalg.norm(start + delta * t[:, np.newaxis] - point, axis=1)))
+
+    def contains(self, point: np.ndarray) -> bool:
+        '''
+        Verifica se um ponto normalizado (2,) está dentro do polígono formado pelas linhas normalizadas, pela
+        regra par-ímpar.
+        '''
+
+        start = self.vector_lines[:, 0]
+        end = self.vector_lines[:, 1]
+
+        # Arestas que cruzam a horizontal do ponto, à direita dele
+        crosses = (start[:, 1] > point[1]) != (end[:, 1] > point[1])
+        delta_y = np.where(crosses, end[:, 1] - start[:, 1], 1.0)
+        intersection_x = start[:, 0] + (point[1] - start[:, 1]) * (end[:, 0] - start[:, 0]) / delta_y
 
-        for line in self.lines:
-            try:
-                self.vector_lines.append((self.normalized_coords[line[0]], self.normalized_coords[line[1]]))
-            except IndexError:
-                continue
+        return bool(np.count_nonzero(crosses & (point[0] < intersection_x)) % 2)
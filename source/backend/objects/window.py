@@ -2,6 +2,9 @@
 Window.
 '''
 
+import numpy as np
+
+from source.backend.math.matrix import Matrix
 from source.backend.math.vector import Vector
 from source.backend.objects.wireframes_2d import Rectangle
 
@@ -12,10 +15,12 @@ class Window(Rectangle):
     Janela.
     '''
 
-    cop: Vector
+    normalized_coords: np.ndarray
     projected_cop: Vector
     projected_position: Vector
 
+    _local_cop: np.ndarray
+
     def __init__(self,
                  origin: Vector,
                  extension: Vector,
@@ -24,17 +29,29 @@ class Window(Rectangle):
                  line_width: float = 2.0) -> None:
         super().__init__(origin, extension, 'Window', color, line_width, False)
 
-        self.cop = cop
+        # A window normalizada é fixa: as coordenadas iniciais definem o retângulo de clipping
+        self.normalized_coords = self.coords
+        self._local_cop = (cop - self.position).internal_vector_4d
         self.projected_cop = self.cop
         self.projected_position = self.position
 
+        self.generate_vector_lines()
+
+    @property
+    def cop(self) -> Vector:
+        '''
+        Retorna o centro de projeção, que acompanha a transformada da window.
+        '''
+
+        return Vector.from_array(self._transform.matrix @ self._local_cop)
+
     @property
     def origin(self) -> Vector:
         '''
         Retorna a coordenada da origem.
         '''
 
-        return self.coords[0]
+        return Vector.from_array(self.coords[0])
 
     @property
     def extension(self) -> Vector:
@@ -42,7 +59,7 @@ class Window(Rectangle):
         Retorna a coordenada da extensão.
         '''
 
-        return self.coords[2]
+        return Vector.from_array(self.coords[2])
 
     @property
     def normalized_origin(self) -> Vector:
@@ -50,7 +67,7 @@ class Window(Rectangle):
         Retorna a coordenada normalizada da origem.
         '''
 
-        return self.normalized_coords[0]
+        return Vector.from_array(self.normalized_coords[0])
 
     @property
     def normalized_extension(self) -> Vector:
@@ -58,21 +75,21 @@ class Window(Rectangle):
         Retorna a coordenada normalizada da extensão.
         '''
 
-        return self.normalized_coords[2]
+        return Vector.from_array(self.normalized_coords[2])
 
     def calculate_x_axis(self) -> Vector:
         '''
         Calcula o eixo x da window.
         '''
 
-        return self.coords[2] - self.coords[1]
+        return Vector.from_array(self.coords[2] - self.coords[1])
 
     def calculate_y_vector(self) -> Vector:
         '''
         Retorna o vetor que aponta para cima.
         '''
 
-        return self.coords[1] - self.coords[0]
+        return Vector.from_array(self.coords[1] - self.coords[0])
 
     def calculate_z_vector(self) -> Vector:
         '''
@@ -86,14 +103,14 @@ class Window(Rectangle):
         Calcula o eixo x projetado da window.
         '''
 
-        return self.projected_coords[2] - self.projected_coords[1]
+        return Vector.from_array(self.projected_coords[2] - self.projected_coords[1])
 
     def calculate_y_projected_vector(self) -> Vector:
         '''
         Retorna o vetor projetado que aponta para cima.
         '''
 
-        return self.projected_coords[1] - self.projected_coords[0]
+        return Vector.from_array(self.projected_coords[1] - self.projected_coords[0])
 
     def calculate_z_projected_vector(self) -> Vector:
         '''
@@ -109,23 +126,20 @@ class Window(Rectangle):
 
         return (self.projected_position - self.projected_cop).magnitude
 
-    def translate(self, direction: Vector) -> None:
-        coords = self._transform.translate(direction, self.coords + [self.cop])
-        self.coords = coords[:-1]
-        self.cop = coords[-1]
+    def generate_vector_lines(self) -> None:
+        '''
+        Gera as linhas normalizadas (E, 2, 2) da window.
+        '''
 
-    def rescale(self, scale: Vector) -> None:
-        coords = self._transform.rescale(scale, self.coords + [self.cop])
-        self.coords = coords[:-1]
-        self.cop = coords[-1]
+        self.vector_lines = self.normalized_coords[self.lines, :2]
 
-    def rotate(self, rotation: Vector, origin: Vector | None = None) -> None:
-        coords = self._transform.rotate(rotation, self.coords + [self.cop], origin)
-        self.coords = coords[:-1]
-        self.cop = coords[-1]
+    def project_view(self, projection: np.ndarray) -> None:
+        '''
+        Projeta a window, o cop e a posição com a matriz de projeção (sem perspectiva).
+        '''
 
-    def project(self, cop: Vector, normal: Vector, cop_distance) -> None:
-        coords = self._transform.project(cop, normal, cop_distance, self.coords + [cop, self.position], True)
+        coords = np.vstack((self.coords, self.cop.internal_vector_4d, self.position.internal_vector_4d))
+        coords = Matrix.multiply_vectors(projection, coords)
         self.projected_coords = coords[:-2]
-        self.projected_cop = coords[-2]
-        self.projected_position = coords[-1]
+        self.projected_cop = Vector.from_array(coords[-2])
+        self.projected_position = Vector.from_array(coords[-1])
@@ -4,6 +4,7 @@ Módulo para wireframes.
 
 import numpy as np
 
+from source.backend.math.matrix import Matrix
 from source.backend.math.vector import Vector
 from source.backend.objects.object import Object, ObjectType
 
@@ -123,18 +124,18 @@ class BezierCurve(Object):
                  name: str = '',
                  color: tuple = (1.0, 1.0, 1.0),
                  line_width: float = 1.0) -> None:
-        corrected_points = []
         curve_coords = []
 
         for i in range(0, len(curve_points), 3):
             if i == len(curve_points) - 1:
                 break
 
-            corrected_points.append((curve_points[i], curve_points[i + 1], curve_points[i + 2], curve_points[i + 3]))
-            curve_coords += self.generate_curve_coords(curve_points[i],
-                                                       curve_points[i + 1: i + 3],
-                                                       curve_points[i + 3],
-                                                       steps)
+            curve_coords.append(self.generate_curve_coords(curve_points[i],
+                                                           curve_points[i + 1: i + 3],
+                                                           curve_points[i + 3],
+                                                           steps))
+
+        curve_coords = Matrix.to_homogeneous(np.vstack(curve_coords))
 
         lines = []
 
@@ -147,33 +148,22 @@ class BezierCurve(Object):
                               start: Vector,
                               control_points: tuple[Vector],
                               end: Vector,
-                              steps: int) -> tuple[Vector]:
+                              steps: int) -> np.ndarray:
         '''
         Gera a curva de Bezier.
         '''
 
-        bezier_points_x = np.matrix([[start.x], [control_points[0].x], [control_points[1].x], [end.x]])
-        bezier_points_y = np.matrix([[start.y], [control_points[0].y], [control_points[1].y], [end.y]])
-
-        bezier_matrix = np.matrix([[-1, 3, -3, 1],
-                                   [3, -6, 3, 0],
-                                   [-3, 3, 0, 0],
-                                   [1, 0, 0, 0]])
-
-        curve = []
-
-        for step in range(steps):
+        bezier_points = np.array([[start.x, start.y],
+                                  [control_points[0].x, control_points[0].y],
+                                  [control_points[1].x, control_points[1].y],
+                                  [end.x, end.y]])
 
-            t = step / steps
+        bezier_matrix = np.array([[-1, 3, -3, 1],
+                                  [3, -6, 3, 0],
+                                  [-3, 3, 0, 0],
+                                  [1, 0, 0, 0]])
 
-            step_matrix = np.matrix([t**3, t**2, t, 1])
-
-            new_x = step_matrix * bezier_matrix * bezier_points_x
-            new_y = step_matrix * bezier_matrix * bezier_points_y
-
-            curve.append(Vector(new_x[0, 0], new_y[0, 0], 0.0))
-
-        return tuple(curve)
+        return Matrix.build_step_matrix(steps) @ bezier_matrix @ bezier_points
 
 
 class SplineCurve(Object):
@@ -192,13 +182,15 @@ class SplineCurve(Object):
                  line_width: float = 1.0,
                  forward_diff: bool = True) -> None:
 
-        spline_coords = []
+        spline_coords = None
 
         if forward_diff:
             spline_coords = self.generate_spline_coords_fwd(spline_points, steps, closed)
         else:
             spline_coords = self.generate_spline_coords(spline_points, steps, closed)
 
+        spline_coords = Matrix.to_homogeneous(spline_coords)
+
         lines = []
 
         for i, _ in enumerate(spline_coords):
@@ -209,134 +201,64 @@ class SplineCurve(Object):
 
         super().__init__(spline_coords, tuple(lines), name, color, line_width, ObjectType.SPLINE_CURVE, fill, closed)
 
-    def generate_spline_coords_fwd(self, points: tuple[Vector], steps: int, closed: bool) -> tuple[Vector]:
+    @staticmethod
+    def generate_geometry_matrices(points: tuple[Vector], closed: bool) -> np.ndarray:
         '''
-        Gera a curva spline com forward differeces.
+        Gera as matrizes de geometria (4, 2) de cada segmento do spline.
         '''
 
-        spline_coords = []
-
-        b_spline_matrix = (1 / 6) * np.matrix([[-1, 3, -3, 1],
-                                               [3, -6, 3, 0],
-                                               [-3, 0, 3, 0],
-                                               [1, 4, 1, 0]])
-
-        delta = 1.0 / steps
-
-        diff_matrix = np.matrix([[0, 0, 0, 1],
-                                 [delta**3, delta**2, delta, 0],
-                                 [6 * delta**3, 2 * delta**2, 0, 0],
-                                 [6 * delta**3, 0, 0, 0]])
-
-        for i, _ in enumerate(points):
-            geometry_matrix_x = None
-            geometry_matrix_y = None
+        points_array = np.array([[point.x, point.y] for point in points]).reshape(-1, 2)
+        segment_count = len(points) if closed else max(len(points) - 3, 0)
+        indices = (np.arange(segment_count)[:, np.newaxis] + np.arange(4)) % max(len(points), 1)
 
-            if i + 3 < len(points):
-                geometry_matrix_x = np.matrix([[points[i].x], [points[i + 1].x], [points[i + 2].x], [points[i + 3].x]])
-                geometry_matrix_y = np.matrix([[points[i].y], [points[i + 1].y], [points[i + 2].y], [points[i + 3].y]])
-            else:
-                if closed:
-                    points_len = len(points)
-                    index_a = i % points_len
-                    index_b = (i + 1) % points_len
-                    index_c = (i + 2) % points_len
-                    index_d = (i + 3) % points_len
-
-                    geometry_matrix_x = np.matrix([[points[index_a].x],
-                                                   [points[index_b].x],
-                                                   [points[index_c].x],
-                                                   [points[index_d].x]])
+        return points_array[indices]
 
-                    geometry_matrix_y = np.matrix([[points[index_a].y],
-                                                   [points[index_b].y],
-                                                   [points[index_c].y],
-                                                   [points[index_d].y]])
-                else:
-                    break
+    def generate_spline_coords_fwd(self, points: tuple[Vector], steps: int, closed: bool) -> np.ndarray:
+        '''
+        Gera a curva spline com forward differeces.
+        '''
 
-            coeff_matrix_x = b_spline_matrix * geometry_matrix_x
-            coeff_matrix_y = b_spline_matrix * geometry_matrix_y
+        spline_coords = []
 
-            initial_conditions_matrix_x = diff_matrix * coeff_matrix_x
-            initial_conditions_matrix_y = diff_matrix * coeff_matrix_y
+        b_spline_matrix = (1 / 6) * np.array([[-1, 3, -3, 1],
+                                              [3, -6, 3, 0],
+                                              [-3, 0, 3, 0],
+                                              [1, 4, 1, 0]])
 
-            new_x = initial_conditions_matrix_x[0, 0]
-            new_y = initial_conditions_matrix_y[0, 0]
+        delta = 1.0 / steps
 
-            delta_x = initial_conditions_matrix_x[1, 0]
-            delta2_x = initial_conditions_matrix_x[2, 0]
-            delta3_x = initial_conditions_matrix_x[3, 0]
+        diff_matrix = np.array([[0, 0, 0, 1],
+                                [delta**3, delta**2, delta, 0],
+                                [6 * delta**3, 2 * delta**2, 0, 0],
+                                [6 * delta**3, 0, 0, 0]])
 
-            delta_y = initial_conditions_matrix_y[1, 0]
-            delta2_y = initial_conditions_matrix_y[2, 0]
-            delta3_y = initial_conditions_matrix_y[3, 0]
+        for geometry_matrix in self.generate_geometry_matrices(points, closed):
+            # Linhas: valor inicial e as três diferenças, com as colunas x e y
+            new_coord, delta_1, delta_2, delta_3 = diff_matrix @ b_spline_matrix @ geometry_matrix
 
-            spline_coords.append(Vector(new_x, new_y, 0.0))
+            spline_coords.append(new_coord)
 
             for _ in range(steps):
+                new_coord = new_coord + delta_1
+                delta_1 = delta_1 + delta_2
+                delta_2 = delta_2 + delta_3
 
-                new_x += delta_x
-                new_y += delta_y
-
-                delta_x += delta2_x
-                delta_y += delta2_y
+                spline_coords.append(new_coord)
 
-                delta2_x += delta3_x
-                delta2_y += delta3_y
+        return np.array(spline_coords).reshape(-1, 2)
 
-                spline_coords.append(Vector(new_x, new_y, 0.0))
-
-        return tuple(spline_coords)
-
-    def generate_spline_coords(self, points: tuple[Vector], steps: int, closed: bool) -> tuple[Vector]:
+    def generate_spline_coords(self, points: tuple[Vector], steps: int, closed: bool) -> np.ndarray:
         '''
         Gera a curva spline.
         '''
 
-        b_spline_matrix = (1 / 6) * np.matrix([[-1, 3, -3, 1],
-                                               [3, -6, 3, 0],
-                                               [-3, 0, 3, 0],
-                                               [1, 4, 1, 0]])
-
-        spline_coords = []
-
-        for i, _ in enumerate(points):
-
-            geometry_matrix_x = None
-            geometry_matrix_y = None
+        b_spline_matrix = (1 / 6) * np.array([[-1, 3, -3, 1],
+                                              [3, -6, 3, 0],
+                                              [-3, 0, 3, 0],
+                                              [1, 4, 1, 0]])
 
-            if i + 3 < len(points):
-
-                geometry_matrix_x = np.matrix([[points[i].x], [points[i + 1].x], [points[i + 2].x], [points[i + 3].x]])
-                geometry_matrix_y = np.matrix([[points[i].y], [points[i + 1].y], [points[i + 2].y], [points[i + 3].y]])
-            else:
+        step_matrix = Matrix.build_step_matrix(steps)
+        geometry_matrices = self.generate_geometry_matrices(points, closed)
 
-                if closed:
-                    points_len = len(points)
-                    index_a = i % points_len
-                    index_b = (i + 1) % points_len
-                    index_c = (i + 2) % points_len
-                    index_d = (i + 3) % points_len
-
-                    geometry_matrix_x = np.matrix([[points[index_a].x],
-                                                   [points[index_b].x],
-                                                   [points[index_c].x],
-                                                   [points[index_d].x]])
-
-                    geometry_matrix_y = np.matrix([[points[index_a].y],
-                                                   [points[index_b].y],
-                                                   [points[index_c].y],
-                                                   [points[index_d].y]])
-                else:
-                    break
-
-            for step in range(steps):
-
-                t = step / steps
-                step_matrix = np.matrix([t**3, t**2, t, 1])
-                new_x = step_matrix * b_spline_matrix * geometry_matrix_x
-                new_y = step_matrix * b_spline_matrix * geometry_matrix_y
-                spline_coords.append(Vector(new_x[0, 0], new_y[0, 0], 0.0))
-
-        return tuple(spline_coords)
+        # (segmentos, passos, 2), concatenado na ordem dos segmentos
+        return (step_matrix @ b_spline_matrix @ geometry_matrices).reshape(-1, 2)
@@ -4,6 +4,7 @@ Módulo para wireframes 3D.
 
 import numpy as np
 
+from source.backend.math.matrix import Matrix
 from source.backend.math.vector import Vector
 from source.backend.objects.wireframes_2d import Object, ObjectType
 
@@ -81,73 +82,29 @@ class Surface(Wireframe3D):
 
     def generate_surface_coords(self,
                                 points: tuple[Vector],
-                                steps: int) -> tuple[tuple[Vector], tuple[tuple[int, int]]]:
+                                steps: int) -> tuple[np.ndarray, np.ndarray]:
         '''
         Gera uma superfície.
         '''
 
-        b_spline_matrix = (1 / 6) * np.matrix([[-1, 3, -3, 1],
-                                               [3, -6, 3, 0],
-                                               [-3, 0, 3, 0],
-                                               [1, 4, 1, 0]])
+        b_spline_matrix = (1 / 6) * np.array([[-1, 3, -3, 1],
+                                              [3, -6, 3, 0],
+                                              [-3, 0, 3, 0],
+                                              [1, 4, 1, 0]])
 
-        b_spline_matrix_t = b_spline_matrix.getT()
+        if len(points) < 16:
+            return (np.empty((0, 4)), np.empty((0, 2), dtype=np.int64))
 
-        surface_coords = []
-        lines = []
+        # Matrizes de geometria (3, 4, 4), uma para cada componente
+        geometry_matrices = np.array([[point.x, point.y, point.z] for point in points[:16]]).T.reshape(3, 4, 4)
+        step_matrix = Matrix.build_step_matrix(steps)
 
-        for i, _ in enumerate(points):
+        # Superfície (3, s, t) avaliada em todos os passos de uma vez
+        surface = step_matrix @ b_spline_matrix @ geometry_matrices @ b_spline_matrix.T @ step_matrix.T
+        surface_coords = Matrix.to_homogeneous(surface.reshape(3, -1).T)
 
-            geometry_matrix_x = None
-            geometry_matrix_y = None
-            geometry_matrix_z = None
+        indices = np.arange(steps * steps).reshape(steps, steps)
+        lines_t = np.stack((indices[:, :-1], indices[:, 1:]), axis=-1).reshape(-1, 2)
+        lines_s = np.stack((indices[:-1, :], indices[1:, :]), axis=-1).reshape(-1, 2)
 
-            if i + 15 < len(points):
-                geometry_matrix_x = np.matrix([[points[i+j].x for j in range(4)] for i in range(0, len(points), 4)])
-                geometry_matrix_y = np.matrix([[points[i+j].y for j in range(4)] for i in range(0, len(points), 4)])
-                geometry_matrix_z = np.matrix([[points[i+j].z for j in range(4)] for i in range(0, len(points), 4)])
-            else:
-                break
-
-            line_index = 0
-            fill_curve_a = True
-            curve_a = []
-            curve_b = []
-
-            for step_s in range(steps):
-                s = step_s / steps
-                step_matrix_s = np.matrix([s**3, s**2, s, 1])
-                for step_t in range(steps):
-                    t = step_t / steps
-                    step_matrix_t = np.matrix([[t**3], [t**2], [t], [1]])
-                    new_x = step_matrix_s * b_spline_matrix * geometry_matrix_x * b_spline_matrix_t * step_matrix_t
-                    new_y = step_matrix_s * b_spline_matrix * geometry_matrix_y * b_spline_matrix_t * step_matrix_t
-                    new_z = step_matrix_s * b_spline_matrix * geometry_matrix_z * b_spline_matrix_t * step_matrix_t
-                    surface_coords.append(Vector(new_x[0, 0], new_y[0, 0], new_z[0, 0]))
-
-                    if line_index + 1 < len(surface_coords):
-                        lines.append((line_index, line_index + 1))
-
-                        if fill_curve_a:
-                            curve_a.append(line_index)
-                        else:
-                            curve_b.append(line_index)
-                        line_index += 1
-
-                if fill_curve_a:
-                    curve_a.append(line_index)
-                else:
-                    curve_b.append(line_index)
-
-                if len(curve_a) > 0 and len(curve_b) > 0:
-
-                    for index_a, index_b in zip(curve_a, curve_b):
-                        lines.append((index_a, index_b))
-
-                    curve_a = curve_b.copy()
-                    curve_b.clear()
-
-                line_index += 1
-                fill_curve_a = False
-
-        return (tuple(surface_coords), tuple(lines))
+        return (surface_coords, np.vstack((lines_t, lines_s)))
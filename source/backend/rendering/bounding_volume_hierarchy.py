@@ -0,0 +1,255 @@
+'''
+Hierarquia de volumes envolventes.
+'''
+
+from __future__ import annotations
+
+import numpy as np
+
+from source.backend.objects.object import Object
+
+
+class BVHNode():
+
+    '''
+    Nó da hierarquia: folhas guardam um objeto e nós internos guardam dois filhos.
+    '''
+
+    lower: np.ndarray
+    upper: np.ndarray
+    parent: BVHNode | None
+    left: BVHNode | None
+    right: BVHNode | None
+    obj: Object | None
+
+    def __init__(self, lower: np.ndarray, upper: np.ndarray, obj: Object | None = None) -> None:
+        self.lower = lower
+        self.upper = upper
+        self.parent = None
+        self.left = None
+        self.right = None
+        self.obj = obj
+
+    @property
+    def is_leaf(self) -> bool:
+        '''
+        Verifica se o nó é uma folha.
+        '''
+
+        return self.obj is not None
+
+    def refit(self) -> None:
+        '''
+        Ajusta a caixa do nó interno para envolver os filhos.
+        '''
+
+        self.lower = np.minimum(self.left.lower, self.right.lower)
+        self.upper = np.maximum(self.left.upper, self.right.upper)
+
+
+class BoundingVolumeHierarchy():
+
+    '''
+    Árvore dinâmica de caixas alinhadas aos eixos (AABB) sobre os limites de mundo dos objetos.
+
+    As folhas guardam caixas alargadas por uma margem, então pequenas transformações não mexem na árvore.
+    As consultas descem apenas pelos nós que interceptam a região, com custo proporcional ao que é visível.
+    '''
+
+    _root: BVHNode | None
+    _leaves: dict[Object, BVHNode]
+    _margin: float
+
+    def __init__(self, margin: float = 0.1) -> None:
+        self._root = None
+        self._leaves = {}
+        self._margin = margin
+
+    def __len__(self) -> int:
+        return len(self._leaves)
+
+    def __contains__(self, obj: Object) -> bool:
+        return obj in self._leaves
+
+    @staticmethod
+    def surface_area(lower: np.ndarray, upper: np.ndarray) -> float:
+        '''
+        Retorna a metade da área da superfície de uma caixa, usada como custo de inserção.
+        '''
+
+        size = upper - lower
+
+        return size[0] * size[1] + size[1] * size[2] + size[2] * size[0]
+
+    def insert(self, obj: Object) -> None:
+        '''
+        Insere um objeto.
+        '''
+
+        lower, upper = obj.bounding_box
+
+        # Uma caixa não finita (vértices NaN ou infinitos) contaminaria todos os ancestrais no refit
+        if not (np.all(np.isfinite(lower)) and np.all(np.isfinite(upper))):
+            return
+
+        margin = (upper - lower) * self._margin + 1.0
+        leaf = BVHNode(lower - margin, upper + margin, obj)
+
+        self._leaves[obj] = leaf
+        self._insert_leaf(leaf)
+
+    def remove(self, obj: Object) -> None:
+        '''
+        Remove um objeto.
+        '''
+
+        leaf = self._leaves.pop(obj, None)
+
+        if leaf is not None:
+            self._remove_leaf(leaf)
+
+    def update(self, obj: Object) -> None:
+        '''
+        Atualiza a folha de um objeto transformado; a árvore só muda quando o objeto sai da caixa alargada.
+        '''
+
+        leaf = self._leaves.get(obj)
+
+        if leaf is None:
+            return
+
+        lower, upper = obj.bounding_box
+
+        if np.all(leaf.lower <= lower) and np.all(upper <= leaf.upper):
+            return
+
+        self.remove(obj)
+        self.insert(obj)
+
+    def query(self, planes: np.ndarray) -> list[Object]:
+        '''
+        Retorna os objetos cujas caixas interceptam o volume delimitado pelos planos (P, 4) de mundo,
+        onde um ponto p está dentro quando planes @ p >= 0.
+        '''
+
+        if self._root is None:
+            return []
+
+        normals = planes[:, :3]
+        offsets = planes[:, 3]
+        abs_normals = np.abs(normals)
+
+        objects = []
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+
+            center = (node.lower + node.upper) * 0.5
+            half = (node.upper - node.lower) * 0.5
+            distances = normals @ center + offsets
+            radii = abs_normals @ half
+
+            if np.any(distances < -radii):
+                continue
+
+            # Nós inteiramente dentro do volume não precisam testar os descendentes
+            if np.all(distances >= radii):
+                objects.extend(self._collect(node))
+            elif node.is_leaf:
+                objects.append(node.obj)
+            else:
+                stack.append(node.right)
+                stack.append(node.left)
+
+        return objects
+
+    def _collect(self, node: BVHNode) -> list[Object]:
+        '''
+        Retorna todos os objetos de uma subárvore.
+        '''
+
+        objects = []
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+
+            if node.is_leaf:
+                objects.append(node.obj)
+            else:
+                stack.append(node.right)
+                stack.append(node.left)
+
+        return objects
+
+    def _insert_leaf(self, leaf: BVHNode) -> None:
+        '''
+        Insere uma folha ao lado do irmão que menos aumenta a área da árvore.
+        '''
+
+        if self._root is None:
+            self._root = leaf
+            return
+
+        sibling = self._root
+
+        while not sibling.is_leaf:
+            costs = []
+
+            for child in (sibling.left, sibling.right):
+                union_area = self.surface_area(np.minimum(child.lower, leaf.lower), np.maximum(child.upper, leaf.upper))
+                costs.append(union_area - self.surface_area(child.lower, child.upper))
+
+            sibling = sibling.left if costs[0] <= costs[1] else sibling.right
+
+        old_parent = sibling.parent
+        new_parent = BVHNode(np.minimum(sibling.lower, leaf.lower), np.maximum(sibling.upper, leaf.upper))
+        new_parent.parent = old_parent
+        new_parent.left = sibling
+        new_parent.right = leaf
+        sibling.parent = new_parent
+        leaf.parent = new_parent
+
+        if old_parent is None:
+            self._root = new_parent
+        elif old_parent.left is sibling:
+            old_parent.left = new_parent
+        else:
+            old_parent.right = new_parent
+
+        self._refit_ancestors(new_parent.parent)
+
+    def _remove_leaf(self, leaf: BVHNode) -> None:
+        '''
+        Remove uma folha, promovendo o irmão para o lugar do pai.
+        '''
+
+        parent = leaf.parent
+
+        if parent is None:
+            self._root = None
+            return
+
+        sibling = parent.right if parent.left is leaf else parent.left
+        grandparent = parent.parent
+        sibling.parent = grandparent
+
+        if grandparent is None:
+            self._root = sibling
+        else:
+            if grandparent.left is parent:
+                grandparent.left = sibling
+            else:
+                grandparent.right = sibling
+
+            self._refit_ancestors(grandparent)
+
+    def _refit_ancestors(self, node: BVHNode | None) -> None:
+        '''
+        Ajusta as caixas do nó até a raiz.
+        '''
+
+        while node is not None:
+            node.refit()
+            node = node.parent
@@ -2,8 +2,11 @@
 Módulo de clipping.
 '''
 
-from enum import Enum
+from enum import Enum, IntFlag
 from math import inf
+from weakref import WeakKeyDictionary
+
+import numpy as np
 
 from source.backend.math.vector import Vector
 from source.backend.objects.object import Object, ObjectType
@@ -19,6 +22,18 @@ class LineClippingMethod(Enum):
     LIANG_BARSKY = 2
 
 
+class RegionCode(IntFlag):
+    '''
+    Códigos de região do Cohen-Sutherland.
+    '''
+
+    INSIDE = 0b0000
+    LEFT = 0b0001
+    RIGHT = 0b0010
+    BOTTOM = 0b0100
+    TOP = 0b1000
+
+
 class Intersection(Enum):
     '''
     Tipos de interseção.
@@ -38,9 +53,11 @@ class Clipper():
     '''
 
     _method: LineClippingMethod
+    _cache: WeakKeyDictionary
 
     def __init__(self) -> None:
         self._clipping_method = LineClippingMethod.LIANG_BARSKY
+        self._cache = WeakKeyDictionary()
 
     @property
     def clipping_method(self) -> LineClippingMethod:
@@ -60,87 +77,114 @@ class Clipper():
         else:
             self._clipping_method = LineClippingMethod.COHEN_SUTHERLAND
 
-    def clip(self, window: Window, object_: Object) -> list[list[Vector]]:
+    def clip(self, window: Window, object_: Object) -> np.ndarray:
         '''
         Faz o clipping do objeto.
+
+        O resultado é reaproveitado enquanto as linhas do objeto e o método de clipping não mudarem. Objetos
+        inteiramente dentro ou fora da window não passam pelo clipping por aresta.
         '''
 
-        if object_.fill:
-            return self.clip_polygon(window, object_)
+        cached = self._cache.get(object_)
+
+        if cached is not None and cached[0] is object_.vector_lines and cached[1] == self._clipping_method:
+            return cached[2]
+
+        lines = object_.vector_lines
+        lower = lines.min(axis=(0, 1), initial=inf)
+        upper = lines.max(axis=(0, 1), initial=-inf)
+        origin = window.normalized_origin
+        extension = window.normalized_extension
+
+        # Aceitação e rejeição triviais do objeto inteiro pela caixa envolvente normalizada
+        if len(lines) == 0 or \
+           upper[0] < origin.x or lower[0] > extension.x or upper[1] < origin.y or lower[1] > extension.y:
+            clipped_lines = np.empty((0, 2, 2))
+        elif origin.x <= lower[0] and upper[0] <= extension.x and origin.y <= lower[1] and upper[1] <= extension.y:
+            clipped_lines = lines
+        elif object_.fill:
+            clipped_lines = self.clip_polygon(window, object_)
+        else:
+            clipped_lines = self.clip_lines(window, object_)
+
+        self._cache[object_] = (object_.vector_lines, self._clipping_method, clipped_lines)
 
-        return self.clip_lines(window, object_)
+        return clipped_lines
 
-    def clip_polygon(self, window: Window, object_: Object) -> list[list[Vector]]:
+    def clip_polygon(self, window: Window, object_: Object) -> np.ndarray:
         '''
         Faz o clipping de um objeto e o converte para a representação em linhas.
 
-        O algoritmo de clipping de polígonos é o Sutherland-Hodgeman.
+        O algoritmo de clipping de polígonos é o Sutherland-Hodgeman, aplicado ao anel de vértices (N, 2)
+        do polígono em uma borda por vez.
         '''
 
-        coords = object_.normalized_coords
+        lines = object_.vector_lines
+
+        if object_.object_type == ObjectType.POINT:
+            if len(lines) > 0 and \
+               (window.normalized_origin.x <= lines[0, 0, 0] <= window.normalized_extension.x) and \
+               (window.normalized_origin.y <= lines[0, 0, 1] <= window.normalized_extension.y):
+                return lines[:1]
+
+            return np.empty((0, 2, 2))
+
+        if len(lines) == 0:
+            return lines
+
+        ring = lines[:, 0]
 
-        clipped_lines = []
+        # Polígonos abertos são fechados pelo último ponto
+        if not np.array_equal(lines[-1, 1], lines[0, 0]):
+            ring = np.vstack((ring, lines[-1, 1]))
 
-        if object_.object_type == ObjectType.POINT and len(coords) > 0:
-            if (window.normalized_origin.x <= coords[0].x <= window.normalized_extension.x) and \
-               (window.normalized_origin.y <= coords[0].y <= window.normalized_extension.y):
-                clipped_lines.append(object_.vector_lines[0])
+        origin = window.normalized_origin
+        extension = window.normalized_extension
+
+        for axis, boundary, inside_greater in ((0, origin.x, True),
+                                               (0, extension.x, False),
+                                               (1, origin.y, True),
+                                               (1, extension.y, False)):
+            ring = self.clip_ring(ring, axis, boundary, inside_greater)
+
+        return np.stack((ring, np.roll(ring, -1, axis=0)), axis=1)
+
+    def clip_ring(self, ring: np.ndarray, axis: int, boundary: float, inside_greater: bool) -> np.ndarray:
+        '''
+        Recorta um anel de vértices (N, 2) por uma borda da window, emitindo o novo anel diretamente.
+
+        Para cada aresta (atual, seguinte): dentro-dentro emite a seguinte, dentro-fora emite a interseção,
+        fora-dentro emite a interseção e a seguinte e fora-fora não emite nada.
+        '''
+
+        if len(ring) == 0:
+            return ring
+
+        following = np.roll(ring, -1, axis=0)
+
+        if inside_greater:
+            inside = ring[:, axis] >= boundary
         else:
-            clipped_lines = object_.vector_lines
-            clipped_lines_temp = []
-
-            for inter in [Intersection.LEFT, Intersection.RIGHT, Intersection.BOTTOM, Intersection.TOP]:
-                for line in clipped_lines:
-                    comp_inside = None
-                    comp_a = None
-                    comp_b = None
-
-                    match inter:
-                        case Intersection.LEFT:
-                            comp_inside = line[0].x > window.normalized_origin.x and \
-                                line[1].x > window.normalized_origin.x
-                            comp_a = line[0].x > window.normalized_origin.x
-                            comp_b = line[1].x > window.normalized_origin.x
-                        case Intersection.RIGHT:
-                            comp_inside = line[0].x < window.normalized_extension.x and \
-                                line[1].x < window.normalized_extension.x
-                            comp_a = line[0].x < window.normalized_extension.x
-                            comp_b = line[1].x < window.normalized_extension.x
-                        case Intersection.BOTTOM:
-                            comp_inside = line[0].y > window.normalized_origin.y and \
-                                line[1].y > window.normalized_origin.y
-                            comp_a = line[0].y > window.normalized_origin.y
-                            comp_b = line[1].y > window.normalized_origin.y
-                        case Intersection.TOP:
-                            comp_inside = line[0].y < window.normalized_extension.y and \
-                                line[1].y < window.normalized_extension.y
-                            comp_a = line[0].y < window.normalized_extension.y
-                            comp_b = line[1].y < window.normalized_extension.y
-
-                    if comp_inside:
-                        clipped_lines_temp.append(line)
-                    elif comp_a:
-                        intersection = self.intersection(window, line, None, inter, False)
-                        clipped_lines_temp.append(intersection)
-                    elif comp_b:
-                        intersection = self.intersection(window, line, inter, None, False)
-                        clipped_lines_temp.append(intersection)
-
-                # Patch de linhas
-                if object_.fill:
-                    for i, _ in enumerate(clipped_lines_temp):
-                        if i < len(clipped_lines_temp) - 1:
-                            if clipped_lines_temp[i][1] != clipped_lines_temp[i + 1][0]:
-                                clipped_lines_temp.insert(i + 1,
-                                                          [clipped_lines_temp[i][1], clipped_lines_temp[i + 1][0]])
-                        else:
-                            if clipped_lines_temp[i][1] != clipped_lines_temp[0][0]:
-                                clipped_lines_temp.append([clipped_lines_temp[i][1], clipped_lines_temp[0][0]])
-
-                clipped_lines = clipped_lines_temp.copy()
-                clipped_lines_temp.clear()
+            inside = ring[:, axis] <= boundary
 
-        return clipped_lines
+        inside_following = np.roll(inside, -1)
+        crossing = inside != inside_following
+
+        # Saída de cada aresta: a interseção (se cruzar a borda) seguida do próximo vértice (se estiver dentro)
+        counts = crossing.astype(np.int64) + inside_following
+        offsets = np.cumsum(counts) - counts
+
+        start = ring[crossing]
+        delta = following[crossing] - start
+        t = (boundary - start[:, axis]) / delta[:, axis]
+        intersections = start + delta * t[:, np.newaxis]
+        intersections[:, axis] = boundary
+
+        clipped_ring = np.empty((counts.sum(), 2))
+        clipped_ring[offsets[crossing]] = intersections
+        clipped_ring[offsets[inside_following] + crossing[inside_following]] = following[inside_following]
+
+        return clipped_ring
 
     def intersection(self,
                      window: Window,
@@ -194,27 +238,23 @@ class Clipper():
 
         return new_line
 
-    def clip_lines(self, window: Window, object_: Object) -> list[list[Vector]]:
+    def clip_lines(self, window: Window, object_: Object) -> np.ndarray:
         '''
         Faz o clipping das linhas.
+
+        As linhas já marcadas como inteiramente dentro da window no clipping homogêneo são mantidas sem
+        passar pelo algoritmo 2D.
         '''
 
-        clipped_lines = []
+        inside = object_.inside_lines
+        straddling_lines = object_.vector_lines[~inside]
 
         if self._clipping_method == LineClippingMethod.COHEN_SUTHERLAND:
-            def __clip_line(line):
-                return self.cohen_sutherland(window, line)
-        elif self._clipping_method == LineClippingMethod.LIANG_BARSKY:
-            def __clip_line(line):
-                return self.liang_barsky(window, line)
-
-        for line in object_.vector_lines:
-            clipped_line = __clip_line(line)
-
-            if len(clipped_line) > 0:
-                clipped_lines.append(clipped_line)
+            clipped_lines, keep = self.cohen_sutherland_lines(window, straddling_lines)
+        else:
+            clipped_lines, keep = self.liang_barsky_lines(window, straddling_lines)
 
-        return clipped_lines
+        return np.concatenate((object_.vector_lines[inside], clipped_lines[keep]))
 
     def cohen_sutherland(self, window: Window, line: list[Vector]) -> list[Vector]:
         '''
@@ -286,6 +326,85 @@ class Clipper():
 
         return clipped_line
 
+    def region_codes(self, window: Window, lines: np.ndarray) -> np.ndarray:
+        '''
+        Calcula os códigos de região (E, 2) de todos os pontos de um array de linhas (E, 2, 2).
+        '''
+
+        origin = window.normalized_origin
+        extension = window.normalized_extension
+
+        x = lines[:, :, 0]
+        y = lines[:, :, 1]
+
+        return np.where(x < origin.x, RegionCode.LEFT, RegionCode.INSIDE) | \
+            np.where(x > extension.x, RegionCode.RIGHT, RegionCode.INSIDE) | \
+            np.where(y < origin.y, RegionCode.BOTTOM, RegionCode.INSIDE) | \
+            np.where(y > extension.y, RegionCode.TOP, RegionCode.INSIDE)
+
+    def cohen_sutherland_lines(self, window: Window, lines: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Clipping de um array de linhas (E, 2, 2) de uma vez com o algoritmo de Cohen-Sutherland.
+
+        As linhas triviais são aceitas ou rejeitadas em bloco; as restantes passam por iterações em que cada
+        ponto fora da window é levado até uma das bordas do seu código de região. Retorna as linhas recortadas
+        e a máscara das linhas que devem ser mantidas. O método cohen_sutherland é a referência linha a linha.
+        '''
+
+        origin = window.normalized_origin
+        extension = window.normalized_extension
+
+        clipped_lines = lines.copy()
+        keep = np.zeros(len(lines), dtype=bool)
+        pending = np.ones(len(lines), dtype=bool)
+
+        # Cada ponto cruza no máximo duas bordas, então quatro iterações resolvem qualquer linha
+        for _ in range(4):
+            codes = self.region_codes(window, clipped_lines[pending])
+            indices = np.nonzero(pending)[0]
+
+            accepted = (codes[:, 0] | codes[:, 1]) == RegionCode.INSIDE
+            rejected = (codes[:, 0] & codes[:, 1]) != RegionCode.INSIDE
+
+            keep[indices[accepted]] = True
+            pending[indices[accepted | rejected]] = False
+
+            remaining = ~(accepted | rejected)
+            indices = indices[remaining]
+            codes = codes[remaining]
+
+            if len(indices) == 0:
+                break
+
+            segment = clipped_lines[indices]
+            start = segment[:, 0]
+            delta = segment[:, 1] - start
+
+            for point in range(2):
+                code = codes[:, point]
+                new_points = segment[:, point].copy()
+
+                # Uma borda por ponto e por iteração, na ordem topo, base, direita e esquerda
+                top = (code & RegionCode.TOP) != 0
+                bottom = ~top & ((code & RegionCode.BOTTOM) != 0)
+                right = ~top & ~bottom & ((code & RegionCode.RIGHT) != 0)
+                left = ~top & ~bottom & ~right & ((code & RegionCode.LEFT) != 0)
+
+                for mask, axis, boundary in ((top, 1, extension.y),
+                                             (bottom, 1, origin.y),
+                                             (right, 0, extension.x),
+                                             (left, 0, origin.x)):
+                    t = (boundary - start[mask, axis]) / delta[mask, axis]
+                    new_points[mask] = start[mask] + delta[mask] * t[:, np.newaxis]
+                    new_points[mask, axis] = boundary
+
+                clipped_lines[indices, point] = new_points
+
+        # Linhas ainda pendentes após as iterações são descartadas
+        keep[pending] = False
+
+        return clipped_lines, keep
+
     def liang_barsky(self, window: Window, line: list[Vector]) -> list[Vector]:
         '''
         Clipping de linha com o algoritmo de Liang-Barsky.
@@ -338,3 +457,37 @@ class Clipper():
         new_vector_b = Vector(line[0].x + p2 * min_positive, line[0].y + p4 * min_positive)
 
         return [new_vector_a, new_vector_b]
+
+    def liang_barsky_lines(self, window: Window, lines: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Clipping de um array de linhas (E, 2, 2) de uma vez com o algoritmo de Liang-Barsky.
+
+        Retorna as linhas recortadas e a máscara das linhas que devem ser mantidas. O método liang_barsky é a
+        referência linha a linha.
+        '''
+
+        origin = window.normalized_origin
+        extension = window.normalized_extension
+
+        start = lines[:, 0]
+        delta = lines[:, 1] - start
+
+        # Colunas: esquerda, direita, baixo e cima
+        p = np.stack((-delta[:, 0], delta[:, 0], -delta[:, 1], delta[:, 1]), axis=1)
+        q = np.stack((start[:, 0] - origin.x,
+                      extension.x - start[:, 0],
+                      start[:, 1] - origin.y,
+                      extension.y - start[:, 1]), axis=1)
+
+        parallel = p == 0.0
+        ratios = np.divide(q, p, out=np.zeros_like(q), where=~parallel)
+
+        max_negative = np.max(np.where(p < 0.0, ratios, 0.0), axis=1, initial=0.0)
+        min_positive = np.min(np.where(p > 0.0, ratios, 1.0), axis=1, initial=1.0)
+
+        keep = ~np.any(parallel & (q < 0.0), axis=1) & (max_negative <= min_positive)
+
+        clipped_lines = np.stack((start + delta * max_negative[:, np.newaxis],
+                                  start + delta * min_positive[:, np.newaxis]), axis=1)
+
+        return clipped_lines, keep
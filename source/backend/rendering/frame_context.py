@@ -0,0 +1,67 @@
+'''
+Contexto de frame.
+'''
+
+from math import degrees
+
+import numpy as np
+
+from source.backend.math.matrix import Matrix
+from source.backend.math.vector import Vector
+from source.backend.objects.window import Window
+from source.backend.rendering.homogeneous_clipper import HomogeneousClipper
+
+
+class FrameContext():
+
+    '''
+    Matrizes da câmera calculadas uma única vez por frame e compartilhadas por todos os objetos.
+
+    A transformação combina projeção, perspectiva e normalização; como a normalização é afim, ela pode
+    ser aplicada antes da divisão por w sem mudar o resultado.
+    '''
+
+    window: Window
+    window_version: int
+    projection: np.ndarray
+    transformation: np.ndarray
+    window_planes: np.ndarray
+    view_planes: np.ndarray
+
+    def __init__(self, window: Window) -> None:
+        self.window = window
+        self.window_version = window.version
+        self.projection = Matrix.build_projection_matrix(window.cop, window.calculate_z_vector())
+
+        window.project_view(self.projection)
+
+        window_up = window.calculate_y_projected_vector()
+        rotation = degrees(window_up * Vector(0.0, 1.0, 0.0))
+
+        if window_up.x > 0.0:
+            rotation = 360 - rotation
+
+        window_scale = window.scale
+        normalization = Matrix.build_normalization_matrix(window.position,
+                                                          rotation,
+                                                          Vector(1.0 / window_scale.x,
+                                                                 1.0 / window_scale.y,
+                                                                 1.0 / window_scale.z))
+        perspective = Matrix.build_perspective_matrix(window.calculate_cop_distance())
+
+        self.transformation = normalization @ perspective @ self.projection
+
+        normalized_origin = window.normalized_origin
+        normalized_extension = window.normalized_extension
+        self.window_planes = HomogeneousClipper.build_window_planes(normalized_origin.x,
+                                                                    normalized_origin.y,
+                                                                    normalized_extension.x,
+                                                                    normalized_extension.y)
+        self.view_planes = HomogeneousClipper.build_view_planes(self.transformation, self.window_planes)
+
+    def is_outdated(self, window: Window) -> bool:
+        '''
+        Verifica se o contexto precisa ser refeito para a window.
+        '''
+
+        return self.window is not window or self.window_version != window.version
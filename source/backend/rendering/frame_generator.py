@@ -2,10 +2,10 @@
 Gerador de frame.
 '''
 
-from math import degrees
-from source.backend.math.vector import Vector
+from source.backend.math.transform import Transform
 from source.backend.objects.object import Object
 from source.backend.objects.window import Window
+from source.backend.rendering.frame_context import FrameContext
 
 
 class FrameGenerator():
@@ -15,48 +15,84 @@ class FrameGenerator():
     conversão de linhas de índice para linhas de vetores.
     '''
 
+    decompositions_per_frame: int = 0
+    updated_objects_per_frame: int = 0
+    culled_objects_per_frame: int = 0
+
+    _frame_context: FrameContext | None = None
+
     @staticmethod
     def generate_frame(window: Window, objects: list[Object]) -> None:
         '''
         Gera o frame.
         '''
 
-        FrameGenerator.project(window, objects)
-        FrameGenerator.normalize(window, objects)
-        FrameGenerator.generate_vector_lines(window, objects)
+        frame_context = FrameGenerator.build_frame_context(window)
+        outdated_objects, visible_objects = FrameGenerator.update_objects(frame_context, objects)
+
+        FrameGenerator.updated_objects_per_frame = len(outdated_objects)
+        FrameGenerator.culled_objects_per_frame = len(outdated_objects) - len(visible_objects)
+
+        # Decomposições de transformadas feitas desde o último frame (edições e o próprio frame)
+        FrameGenerator.decompositions_per_frame = Transform.reset_decomposition_count()
 
     @staticmethod
-    def project(window: Window, objects: list[Object]) -> None:
+    def update_objects(frame_context: FrameContext, objects: list[Object]) -> tuple[list[Object], list[Object]]:
         '''
-        Gera as linhas de projeção.
+        Atualiza as linhas normalizadas dos objetos, sem alterar as estatísticas do frame, e retorna os objetos
+        reprocessados e os visíveis entre eles.
+        '''
+
+        # Apenas objetos alterados desde o último frame (ou todos, se a window mudou) são reprocessados
+        outdated_objects = [obj for obj in objects if obj.is_outdated(frame_context)]
+        visible_objects = FrameGenerator.cull(frame_context, outdated_objects)
+
+        FrameGenerator.project(frame_context, visible_objects)
+        FrameGenerator.normalize(frame_context, visible_objects)
+
+        return outdated_objects, visible_objects
+
+    @staticmethod
+    def build_frame_context(window: Window) -> FrameContext:
+        '''
+        Retorna o contexto do frame, refeito apenas quando a window muda.
         '''
 
-        normal = window.calculate_z_vector()
-        cop_distance = window.calculate_cop_distance()
+        if FrameGenerator._frame_context is None or FrameGenerator._frame_context.is_outdated(window):
+            FrameGenerator._frame_context = FrameContext(window)
 
-        for obj in objects + [window]:
-            obj.project(window.cop, normal, cop_distance)
+        return FrameGenerator._frame_context
 
     @staticmethod
-    def normalize(window: Window, objects: list[Object]) -> None:
+    def cull(frame_context: FrameContext, objects: list[Object]) -> list[Object]:
         '''
-        Normaliza as coordenadas.
+        Descarta os objetos cuja esfera envolvente está fora do volume de visão e retorna os visíveis.
         '''
 
-        window_up = window.calculate_y_projected_vector()
-        rotation = degrees(window_up * Vector(0.0, 1.0, 0.0))
+        visible_objects = []
+
+        for obj in objects:
+            if obj.is_visible(frame_context):
+                visible_objects.append(obj)
+            else:
+                obj.cull(frame_context)
+
+        return visible_objects
 
-        if window_up.x > 0.0:
-            rotation = 360 - rotation
+    @staticmethod
+    def project(frame_context: FrameContext, objects: list[Object]) -> None:
+        '''
+        Gera as linhas de projeção.
+        '''
 
         for obj in objects:
-            obj.normalize(window.position, window.scale, rotation)
+            obj.project(frame_context)
 
     @staticmethod
-    def generate_vector_lines(window: Window, objects: list[Object]) -> None:
+    def normalize(frame_context: FrameContext, objects: list[Object]) -> None:
         '''
-        Gera as linhas dos vetores.
+        Recorta em coordenadas homogêneas e normaliza as linhas.
         '''
 
-        for obj in objects + [window]:
-            obj.generate_vector_lines()
+        for obj in objects:
+            obj.normalize(frame_context)
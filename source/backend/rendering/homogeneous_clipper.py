@@ -0,0 +1,115 @@
+'''
+Módulo de clipping em coordenadas homogêneas.
+'''
+
+import numpy as np
+
+
+class HomogeneousClipper():
+
+    '''
+    Clipping no espaço de clipping, antes da divisão de perspectiva.
+
+    O plano próximo (w >= NEAR_W) é recortado de forma exata, então arestas que cruzam o plano da câmera
+    são cortadas no lugar certo. Os quatro planos da window servem para descartar arestas totalmente fora
+    e marcar as totalmente dentro; só as que cruzam uma borda ficam para o clipper 2D.
+    '''
+
+    NEAR_W: float = 1e-3
+
+    @staticmethod
+    def build_window_planes(origin_x: float, origin_y: float, extension_x: float, extension_y: float) -> np.ndarray:
+        '''
+        Constrói os planos (4, 4) da window normalizada; um ponto p está dentro quando planes @ p >= 0.
+        '''
+
+        return np.array([[1.0, 0.0, 0.0, -origin_x],
+                         [-1.0, 0.0, 0.0, extension_x],
+                         [0.0, 1.0, 0.0, -origin_y],
+                         [0.0, -1.0, 0.0, extension_y]])
+
+    @staticmethod
+    def build_view_planes(transformation: np.ndarray, window_planes: np.ndarray) -> np.ndarray:
+        '''
+        Leva os planos da window e o plano próximo para o espaço de mundo, retornando planos (5, 4) com a
+        normal unitária; um ponto de mundo p está dentro do volume de visão quando planes @ p >= 0.
+        '''
+
+        near_plane = transformation[3] - np.array([0.0, 0.0, 0.0, HomogeneousClipper.NEAR_W])
+        view_planes = np.vstack((window_planes @ transformation, near_plane))
+
+        # Planos degenerados (normal nula) não restringem nada e ficam como estão
+        norms = np.linalg.norm(view_planes[:, :3], axis=1)
+        norms[norms == 0.0] = 1.0
+
+        return view_planes / norms[:, np.newaxis]
+
+    @staticmethod
+    def clip_lines(lines: np.ndarray, window_planes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Recorta um array de arestas homogêneas (E, 2, 4) e faz a divisão de perspectiva das que sobram.
+
+        Retorna as linhas normalizadas (E', 2, 2) e a máscara das que estão inteiramente dentro da window.
+        '''
+
+        # Plano próximo
+        near = lines[:, :, 3] - HomogeneousClipper.NEAR_W
+        lines = lines[~np.all(near < 0.0, axis=1)]
+        near = near[~np.all(near < 0.0, axis=1)]
+
+        crossing = np.nonzero(np.any(near < 0.0, axis=1))[0]
+
+        if len(crossing) > 0:
+            lines = lines.copy()
+            start = lines[crossing, 0]
+            delta = lines[crossing, 1] - start
+            t = near[crossing, 0] / (near[crossing, 0] - near[crossing, 1])
+            intersections = start + delta * t[:, np.newaxis]
+
+            outside_point = (near[crossing, 1] < 0.0).astype(np.int64)
+            lines[crossing, outside_point] = intersections
+
+        # Planos da window: descarte trivial e marcação das linhas inteiramente dentro
+        distances = lines @ window_planes.T
+        outside = distances < 0.0
+        rejected = np.any(outside[:, 0] & outside[:, 1], axis=1)
+
+        lines = lines[~rejected]
+        inside = ~np.any(outside[~rejected], axis=(1, 2))
+
+        return lines[:, :, :2] / lines[:, :, 3:], inside
+
+    @staticmethod
+    def clip_ring(ring: np.ndarray, window_planes: np.ndarray) -> np.ndarray:
+        '''
+        Recorta um anel de vértices homogêneos (N, 4) pelo plano próximo (Sutherland-Hodgman) e faz a
+        divisão de perspectiva, retornando o anel normalizado (M, 2).
+
+        Anéis inteiramente fora de algum plano da window são descartados.
+        '''
+
+        if len(ring) == 0 or np.any(np.all(ring @ window_planes.T < 0.0, axis=0)):
+            return np.empty((0, 2))
+
+        near = ring[:, 3] - HomogeneousClipper.NEAR_W
+        inside = near >= 0.0
+
+        if not np.all(inside):
+            following = np.roll(ring, -1, axis=0)
+            inside_following = np.roll(inside, -1)
+            crossing = inside != inside_following
+
+            # Saída de cada aresta: a interseção (se cruzar o plano) seguida do próximo vértice (se estiver dentro)
+            counts = crossing.astype(np.int64) + inside_following
+            offsets = np.cumsum(counts) - counts
+
+            near_following = np.roll(near, -1)
+            t = near[crossing] / (near[crossing] - near_following[crossing])
+            intersections = ring[crossing] + (following[crossing] - ring[crossing]) * t[:, np.newaxis]
+
+            clipped_ring = np.empty((counts.sum(), 4))
+            clipped_ring[offsets[crossing]] = intersections
+            clipped_ring[offsets[inside_following] + crossing[inside_following]] = following[inside_following]
+            ring = clipped_ring
+
+        return ring[:, :2] / ring[:, 3:]
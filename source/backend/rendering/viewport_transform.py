@@ -0,0 +1,48 @@
+'''
+Transformada de viewport.
+'''
+
+import numpy as np
+
+from source.backend.math.vector import Vector
+
+
+class ViewportTransform():
+
+    '''
+    Mapeamento afim entre um retângulo (origem, extensão) e a tela, aplicado a arrays (..., 2) de uma vez.
+
+    O eixo y da tela cresce para baixo, então a escala em y é negativa.
+    '''
+
+    screen_width: int
+    screen_height: int
+    scale: np.ndarray
+    offset: np.ndarray
+
+    def __init__(self, origin: Vector, extension: Vector, screen_width: int, screen_height: int) -> None:
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.scale = np.array([screen_width / (extension.x - origin.x), -screen_height / (extension.y - origin.y)])
+        self.offset = np.array([-origin.x * self.scale[0], screen_height - origin.y * self.scale[1]])
+
+    def to_screen(self, coords: np.ndarray) -> np.ndarray:
+        '''
+        Converte coordenadas (..., 2) do retângulo para coordenadas de tela.
+        '''
+
+        return coords[..., :2] * self.scale + self.offset
+
+    def from_screen(self, coords: np.ndarray) -> np.ndarray:
+        '''
+        Converte coordenadas de tela (..., 2) para coordenadas do retângulo.
+        '''
+
+        return (coords[..., :2] - self.offset) / self.scale
+
+    def matches(self, screen_width: int, screen_height: int) -> bool:
+        '''
+        Verifica se a transformada foi construída para o tamanho de tela.
+        '''
+
+        return self.screen_width == screen_width and self.screen_height == screen_height
@@ -0,0 +1,107 @@
+'''
+Módulo para o cache binário das cenas lidas de arquivos OBJ.
+'''
+
+import json
+import os
+
+import numpy as np
+
+from source.backend.load_statistics import LoadStatistics
+from source.backend.math.matrix import Matrix
+from source.backend.objects.object import Object
+from source.backend.scene_io import SceneIO
+
+
+class SceneCache():
+
+    '''
+    Cache binário (.cache.npz) ao lado do arquivo lido, com os vértices, as linhas e os atributos dos objetos.
+    '''
+
+    VERSION: int = 3
+    KEYS: tuple[str, ...] = ('header', 'attributes', 'vertices', 'vertex_offsets', 'lines', 'line_offsets',
+                             'statistics')
+
+    @staticmethod
+    def path(file_name: str) -> str:
+        '''
+        Retorna o caminho do cache binário de um arquivo.
+        '''
+
+        return file_name + '.cache.npz'
+
+    @staticmethod
+    def read(file_name: str, source_stat: os.stat_result, statistics: LoadStatistics) -> list[Object] | None:
+        '''
+        Lê os objetos do cache binário, ou retorna None se ele não existir ou não corresponder ao arquivo
+        (versão, data de modificação e tamanho).
+        '''
+
+        try:
+            with np.load(SceneCache.path(file_name), allow_pickle=False) as cache:
+                arrays = {key: cache[key] for key in SceneCache.KEYS}
+        except (OSError, KeyError, ValueError):
+            return None
+
+        if arrays['header'].tolist() != [SceneCache.VERSION, source_stat.st_mtime_ns, source_stat.st_size]:
+            return None
+
+        vertices = arrays['vertices']
+        vertex_offsets = arrays['vertex_offsets']
+        lines = arrays['lines']
+        line_offsets = arrays['line_offsets']
+
+        objects = []
+
+        for i, object_attributes in enumerate(arrays['attributes']):
+            coords = Matrix.to_homogeneous(vertices[vertex_offsets[i]:vertex_offsets[i + 1]])
+            objects.append(SceneIO.restore_object(json.loads(str(object_attributes)),
+                                                  coords,
+                                                  lines[line_offsets[i]:line_offsets[i + 1]]))
+
+        statistics.object_count, statistics.vertex_count, statistics.edge_count, \
+            statistics.removed_edge_count = arrays['statistics'].tolist()
+
+        return objects
+
+    @staticmethod
+    def write(file_name: str, source_stat: os.stat_result, entries: list[tuple], statistics: LoadStatistics) -> None:
+        '''
+        Escreve o cache binário com os vértices, as linhas e os atributos (em JSON) dos objetos lidos.
+
+        O arquivo é escrito em um temporário e renomeado, então uma escrita interrompida não deixa um cache
+        corrompido. Nada é escrito se o diretório do arquivo for somente leitura, e uma falha de escrita fica em
+        statistics.cache_error, sem interromper o carregamento.
+        '''
+
+        cache_path = SceneCache.path(file_name)
+
+        if not os.access(os.path.dirname(cache_path) or os.curdir, os.W_OK):
+            return
+
+        vertex_counts = [len(coords) for _, coords, _ in entries]
+        line_counts = [len(lines) for _, _, lines in entries]
+        vertices = np.concatenate([coords[:, :3] for _, coords, _ in entries] + [np.empty((0, 3))])
+        lines = np.concatenate([lines for _, _, lines in entries] + [np.empty((0, 2), dtype=np.int64)])
+        header = np.array([SceneCache.VERSION, source_stat.st_mtime_ns, source_stat.st_size], dtype=np.int64)
+        temporary_path = cache_path + '.tmp'
+
+        try:
+            with open(temporary_path, 'wb') as file:
+                np.savez(file,
+                         header=header,
+                         attributes=np.array([json.dumps(attributes) for attributes, _, _ in entries], dtype=str),
+                         vertices=vertices,
+                         vertex_offsets=np.concatenate(([0], np.cumsum(vertex_counts, dtype=np.int64))),
+                         lines=lines,
+                         line_offsets=np.concatenate(([0], np.cumsum(line_counts, dtype=np.int64))),
+                         statistics=np.array([statistics.object_count,
+                                              statistics.vertex_count,
+                                              statistics.edge_count,
+                                              statistics.removed_edge_count], dtype=np.int64))
+
+            os.replace(temporary_path, cache_path)
+        except OSError as error:
+            SceneIO.discard_file(temporary_path)
+            statistics.cache_error = error
@@ -0,0 +1,85 @@
+'''
+Módulo com as operações comuns aos formatos de cena.
+'''
+
+import os
+
+import numpy as np
+
+from source.backend.objects.object import Object, ObjectType
+
+
+class SceneIO():
+
+    '''
+    Operações comuns aos formatos de cena: os atributos dos objetos e a limpeza de arquivos temporários.
+    '''
+
+    @staticmethod
+    def object_attributes(obj: Object) -> dict:
+        '''
+        Retorna os atributos de um objeto que não fazem parte da geometria, em um dicionário serializável.
+        '''
+
+        return {'name': obj.name,
+                'class': type(obj).__name__,
+                'color': [float(component) for component in obj.color],
+                'line_width': float(obj.line_width),
+                'object_type': obj.object_type.name,
+                'fill': bool(obj.fill),
+                'closed': bool(obj.closed)}
+
+    @staticmethod
+    def restore_object(attributes: dict,
+                       coords: np.ndarray,
+                       lines: np.ndarray,
+                       model_matrix: np.ndarray | None = None,
+                       local_bounds: tuple[float, np.ndarray, np.ndarray] | None = None) -> Object:
+        '''
+        Recria um objeto a partir dos atributos de object_attributes e da geometria lida.
+
+        As subclasses só geram a geometria no construtor, então o objeto é criado com a classe gravada e
+        inicializado diretamente com a geometria do arquivo.
+        '''
+
+        obj = object.__new__(SceneIO.object_classes().get(attributes.get('class'), Object))
+        Object.__init__(obj,
+                        coords,
+                        lines,
+                        attributes['name'],
+                        tuple(attributes['color']),
+                        attributes['line_width'],
+                        ObjectType[attributes['object_type']],
+                        attributes['fill'],
+                        attributes['closed'],
+                        model_matrix,
+                        local_bounds)
+
+        return obj
+
+    @staticmethod
+    def object_classes() -> dict[str, type[Object]]:
+        '''
+        Retorna as classes de objeto pelo nome.
+        '''
+
+        classes = {Object.__name__: Object}
+        pending = [Object]
+
+        while pending:
+            for subclass in pending.pop().__subclasses__():
+                classes[subclass.__name__] = subclass
+                pending.append(subclass)
+
+        return classes
+
+    @staticmethod
+    def discard_file(file_name: str) -> None:
+        '''
+        Remove um arquivo, se ele existir.
+        '''
+
+        try:
+            os.remove(file_name)
+        except FileNotFoundError:
+            pass
@@ -10,6 +10,8 @@ from os.path import join
 from gi.repository import Gtk
 
 from source.handlers.handler import Handler
+from source.handlers.scene_loader import SceneLoader
+from source.backend.load_statistics import LoadStatistics
 from source.backend.objects.object import Object
 
 if TYPE_CHECKING:
@@ -27,6 +29,9 @@ class ObjectListHandler(Handler):
     _file_name_entry: Gtk.Entry
     _load_button: Gtk.Entry
     _save_button: Gtk.Entry
+    _load_progress_bar: Gtk.ProgressBar
+    _scene_loader: SceneLoader
+    _last_loaded_object: Object | None
 
     def __init__(self, handler_mediator: HandlerMediator, main_window: MainWindow) -> None:
         super().__init__(handler_mediator)
@@ -38,23 +43,66 @@ class ObjectListHandler(Handler):
         self._file_name_entry = self.search_child_by_name(object_list_box, 'File name entry')
         self._load_button = self.search_child_by_name(object_list_box, 'Load button')
         self._save_button = self.search_child_by_name(object_list_box, 'Save button')
+        self._load_progress_bar = self.search_child_by_name(object_list_box, 'Load progress bar')
+        self._last_loaded_object = None
+        self._scene_loader = SceneLoader(self.add_loaded_objects,
+                                         self._load_progress_bar.set_fraction,
+                                         self.finish_loading)
 
         self._load_button.connect('clicked', self.load_file)
         self._save_button.connect('clicked', self.save_file)
 
     def load_file(self, _) -> None:
         '''
-        Carrega um arquivo.
+        Carrega um arquivo em segundo plano, ou cancela o carregamento em andamento.
         '''
 
+        if self._scene_loader.is_loading:
+            self._scene_loader.cancel()
+            return
+
         file_name = self._file_name_entry.get_text()
-        anchor = self._handler_mediator.manager_mediator.object_manager.object_in_focus.position
+
+        self._last_loaded_object = None
+        self._load_button.set_label('Cancel')
+        self._load_progress_bar.set_fraction(0.0)
+        self._load_progress_bar.set_text(None)
+        self._scene_loader.load(join('assets', 'objects', file_name))
+
+    def add_loaded_objects(self, objects: list[Object]) -> None:
+        '''
+        Adiciona à cena os objetos entregues pelo carregador.
+        '''
+
         object_manager = self._handler_mediator.manager_mediator.object_manager
 
-        object_manager.load_file(join('assets', 'objects', file_name))
-        self._handler_mediator.transformations_handler.update_object_rotation_anchor(anchor)
-        self._handler_mediator.object_transform_handler.update_spin_buttons()
-        self._handler_mediator.transformations_handler.update_rotation_anchor_spin_buttons()
+        for obj in objects:
+            object_manager.add_object(obj)
+
+        self._last_loaded_object = objects[-1]
+
+    def finish_loading(self,
+                       file_name: str,
+                       statistics: LoadStatistics,
+                       cancelled: bool,
+                       error: Exception | None) -> None:
+        '''
+        Encerra o carregamento, mostrando o resultado na barra de progresso e colocando em foco o último objeto lido.
+        '''
+
+        self._load_button.set_label('Load')
+
+        if error is not None:
+            self._load_progress_bar.set_fraction(0.0)
+            self._load_progress_bar.set_text(f'Failed to load {file_name}: {error}')
+        elif cancelled:
+            self._load_progress_bar.set_fraction(0.0)
+            self._load_progress_bar.set_text(f'Cancelled: {statistics}')
+        else:
+            self._load_progress_bar.set_fraction(1.0)
+            self._load_progress_bar.set_text(f'Loaded: {statistics}')
+
+        self._handler_mediator.viewport_handler.focus_object(self._last_loaded_object)
 
     def save_file(self, _) -> None:
         '''
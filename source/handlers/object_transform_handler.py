@@ -66,13 +66,15 @@ class ObjectTransformHandler(Handler):
         object_in_focus = object_manager.object_in_focus
 
         if user_call and object_in_focus is not None:
-            diff_x = self._position_x_button.get_value() - object_in_focus.position.x
-            diff_y = self._position_y_button.get_value() - object_in_focus.position.y
-            diff_z = self._position_z_button.get_value() - object_in_focus.position.z
+            position = object_in_focus.position
+            diff_x = self._position_x_button.get_value() - position.x
+            diff_y = self._position_y_button.get_value() - position.y
+            diff_z = self._position_z_button.get_value() - position.z
 
             object_in_focus.translate(Vector(diff_x, diff_y, diff_z))
+            self._handler_mediator.viewport_handler.request_redraw()
 
-            object_index = object_manager.objects.index(object_in_focus)
+            object_index = object_manager.index_of(object_in_focus)
             object_manager.update_object_info(object_index)
             self.update_spin_buttons()
 
@@ -85,11 +87,13 @@ class ObjectTransformHandler(Handler):
         object_in_focus = self._handler_mediator.manager_mediator.object_manager.object_in_focus
 
         if user_call and object_in_focus is not None:
-            diff_x = self._scale_x_button.get_value() / object_in_focus.scale.x
-            diff_y = self._scale_y_button.get_value() / object_in_focus.scale.y
-            diff_z = self._scale_z_button.get_value() / object_in_focus.scale.z
+            scale = object_in_focus.scale
+            diff_x = self._scale_x_button.get_value() / scale.x
+            diff_y = self._scale_y_button.get_value() / scale.y
+            diff_z = self._scale_z_button.get_value() / scale.z
 
             object_in_focus.rescale(Vector(diff_x, diff_y, diff_z))
+            self._handler_mediator.viewport_handler.request_redraw()
             self.update_spin_buttons()
 
     def update_rotation(self, _) -> None:
@@ -101,11 +105,13 @@ class ObjectTransformHandler(Handler):
         object_in_focus = self._handler_mediator.manager_mediator.object_manager.object_in_focus
 
         if user_call and object_in_focus is not None:
-            diff_x = self._rotation_x_button.get_value() - object_in_focus.rotation.x
-            diff_y = self._rotation_y_button.get_value() - object_in_focus.rotation.y
-            diff_z = self._rotation_z_button.get_value() - object_in_focus.rotation.z
+            rotation = object_in_focus.rotation
+            diff_x = self._rotation_x_button.get_value() - rotation.x
+            diff_y = self._rotation_y_button.get_value() - rotation.y
+            diff_z = self._rotation_z_button.get_value() - rotation.z
 
             object_in_focus.rotate(Vector(diff_x, diff_y, diff_z))
+            self._handler_mediator.viewport_handler.request_redraw()
             self.update_spin_buttons()
 
     def update_spin_buttons(self) -> None:
@@ -114,15 +120,18 @@ class ObjectTransformHandler(Handler):
         '''
 
         object_in_focus = self._handler_mediator.manager_mediator.object_manager.object_in_focus
+        position = object_in_focus.position
+        scale = object_in_focus.scale
+        rotation = object_in_focus.rotation
 
         self._handler_mediator.main_window_handler.user_call = False
-        self._position_x_button.set_value(object_in_focus.position.x)
-        self._position_y_button.set_value(object_in_focus.position.y)
-        self._position_z_button.set_value(object_in_focus.position.z)
-        self._scale_x_button.set_value(object_in_focus.scale.x)
-        self._scale_y_button.set_value(object_in_focus.scale.y)
-        self._scale_z_button.set_value(object_in_focus.scale.z)
-        self._rotation_x_button.set_value(object_in_focus.rotation.x)
-        self._rotation_y_button.set_value(object_in_focus.rotation.y)
-        self._rotation_z_button.set_value(object_in_focus.rotation.z)
+        self._position_x_button.set_value(position.x)
+        self._position_y_button.set_value(position.y)
+        self._position_z_button.set_value(position.z)
+        self._scale_x_button.set_value(scale.x)
+        self._scale_y_button.set_value(scale.y)
+        self._scale_z_button.set_value(scale.z)
+        self._rotation_x_button.set_value(rotation.x)
+        self._rotation_y_button.set_value(rotation.y)
+        self._rotation_z_button.set_value(rotation.z)
         self._handler_mediator.main_window_handler.user_call = True
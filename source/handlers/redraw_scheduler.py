@@ -0,0 +1,40 @@
+'''
+Módulo para o agendador de redesenhos.
+'''
+
+from gi.repository import GLib, Gtk
+
+
+class RedrawScheduler():
+
+    '''
+    Agenda redesenhos de um widget apenas quando algo muda.
+
+    Os pedidos são acumulados até o próximo tick do frame clock, então no máximo um redesenho é feito por
+    atualização da tela e nenhum quando a cena está parada.
+    '''
+
+    _widget: Gtk.Widget
+    _tick_callback_id: int | None
+
+    def __init__(self, widget: Gtk.Widget) -> None:
+        self._widget = widget
+        self._tick_callback_id = None
+
+    def request_redraw(self) -> None:
+        '''
+        Solicita um redesenho no próximo frame.
+        '''
+
+        if self._tick_callback_id is None:
+            self._tick_callback_id = self._widget.add_tick_callback(self.on_tick)
+
+    def on_tick(self, widget: Gtk.Widget, _) -> bool:
+        '''
+        Evento do frame clock.
+        '''
+
+        self._tick_callback_id = None
+        widget.queue_draw()
+
+        return GLib.SOURCE_REMOVE
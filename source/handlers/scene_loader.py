@@ -0,0 +1,150 @@
+'''
+Módulo para o carregador de cenas em segundo plano.
+'''
+
+from typing import Callable
+import struct
+import threading
+import time
+
+from gi.repository import GLib
+
+from source.backend.file_system import FileSystem
+from source.backend.load_statistics import LoadStatistics
+from source.backend.objects.object import Object
+
+
+class SceneLoader():
+
+    '''
+    Carrega arquivos em uma thread, entregando os objetos ao loop principal do GTK.
+
+    Os objetos lidos são acumulados e entregues em lotes com GLib.idle_add, que tem prioridade menor que a dos
+    redesenhos, então a viewport continua respondendo durante a leitura. O progresso é consultado pelo loop
+    principal em intervalos fixos. O carregamento pode ser cancelado a cada bloco lido. Um erro de leitura (arquivo
+    inacessível ou malformado) encerra o carregamento e é repassado a on_finished; os demais erros também são
+    repassados, mas continuam propagando na thread.
+    '''
+
+    BATCH_INTERVAL: float = 1.0 / 60.0
+    BATCH_SIZE: int = 256
+    PROGRESS_INTERVAL: int = 50
+
+    _on_objects: Callable[[list[Object]], None]
+    _on_progress: Callable[[float], None]
+    _on_finished: Callable[[str, LoadStatistics, bool, Exception | None], None]
+    _file_system: FileSystem | None
+    _cancel_event: threading.Event
+
+    def __init__(self,
+                 on_objects: Callable[[list[Object]], None],
+                 on_progress: Callable[[float], None],
+                 on_finished: Callable[[str, LoadStatistics, bool, Exception | None], None]) -> None:
+        self._on_objects = on_objects
+        self._on_progress = on_progress
+        self._on_finished = on_finished
+        self._file_system = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def is_loading(self) -> bool:
+        '''
+        Verifica se há um carregamento em andamento.
+        '''
+
+        return self._file_system is not None
+
+    def load(self, file_name: str) -> None:
+        '''
+        Inicia o carregamento de um arquivo, se nenhum outro estiver em andamento.
+        '''
+
+        if self.is_loading:
+            return
+
+        # Cada carregamento tem o próprio sistema de arquivos, então as estatísticas não são compartilhadas
+        self._file_system = FileSystem()
+        self._cancel_event = threading.Event()
+
+        threading.Thread(target=self.run,
+                         args=(file_name, self._file_system, self._cancel_event),
+                         daemon=True).start()
+        GLib.timeout_add(SceneLoader.PROGRESS_INTERVAL, self.report_progress, self._file_system)
+
+    def cancel(self) -> None:
+        '''
+        Cancela o carregamento em andamento; os objetos já entregues continuam na cena.
+        '''
+
+        self._cancel_event.set()
+
+    def run(self, file_name: str, file_system: FileSystem, cancel_event: threading.Event) -> None:
+        '''
+        Lê o arquivo na thread de trabalho.
+        '''
+
+        scene = file_system.iter_scene(file_name, cancel_event=cancel_event)
+        batch = []
+        last_delivery = time.monotonic()
+        error = None
+
+        try:
+            for obj in scene:
+                if cancel_event.is_set():
+                    break
+
+                batch.append(obj)
+
+                elapsed = time.monotonic() - last_delivery
+
+                if len(batch) >= SceneLoader.BATCH_SIZE or elapsed >= SceneLoader.BATCH_INTERVAL:
+                    GLib.idle_add(self.deliver, batch, cancel_event)
+                    batch = []
+                    last_delivery = time.monotonic()
+        except (OSError, ValueError, UnicodeDecodeError, struct.error) as exception:
+            error = exception
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            # Fechar o gerador interrompe a leitura e fecha o arquivo sem escrever o cache
+            scene.close()
+
+            GLib.idle_add(self.deliver, batch, cancel_event)
+            GLib.idle_add(self.finish, file_name, file_system, cancel_event, error)
+
+    def deliver(self, batch: list[Object], cancel_event: threading.Event) -> bool:
+        '''
+        Entrega um lote de objetos no loop principal.
+        '''
+
+        if batch and not cancel_event.is_set():
+            self._on_objects(batch)
+
+        return GLib.SOURCE_REMOVE
+
+    def report_progress(self, file_system: FileSystem) -> bool:
+        '''
+        Informa o progresso no loop principal enquanto o carregamento estiver em andamento.
+        '''
+
+        if self._file_system is not file_system:
+            return GLib.SOURCE_REMOVE
+
+        self._on_progress(file_system.statistics.progress)
+
+        return GLib.SOURCE_CONTINUE
+
+    def finish(self,
+               file_name: str,
+               file_system: FileSystem,
+               cancel_event: threading.Event,
+               error: Exception | None) -> bool:
+        '''
+        Encerra o carregamento no loop principal.
+        '''
+
+        self._file_system = None
+        self._on_finished(file_name, file_system.statistics, cancel_event.is_set(), error)
+
+        return GLib.SOURCE_REMOVE
@@ -21,6 +21,7 @@ class SettingsHandler(Handler):
     '''
 
     _clipping_method_button: Gtk.ToggleButton
+    _frame_statistics_button: Gtk.ToggleButton
 
     def __init__(self, handler_mediator: HandlerMediator, main_window: MainWindow) -> None:
         super().__init__(handler_mediator)
@@ -28,8 +29,10 @@ class SettingsHandler(Handler):
         settings_box = main_window.settings_box
 
         self._clipping_method_button = self.search_child_by_name(settings_box, 'Clipping method button')
+        self._frame_statistics_button = self.search_child_by_name(settings_box, 'Frame statistics button')
 
         self._clipping_method_button.connect('toggled', self.toggle_clipping_method)
+        self._frame_statistics_button.connect('toggled', self.toggle_frame_statistics)
 
     def toggle_clipping_method(self, _) -> None:
         '''
@@ -42,3 +45,15 @@ class SettingsHandler(Handler):
             self._clipping_method_button.set_label('Cohen-Sutherland')
         else:
             self._clipping_method_button.set_label('Liang-Barsky')
+
+    def toggle_frame_statistics(self, _) -> None:
+        '''
+        Mostra ou esconde as estatísticas do frame no viewport.
+        '''
+
+        self.handler_mediator.manager_mediator.viewport_manager.toggle_frame_statistics()
+
+        if self._frame_statistics_button.get_active():
+            self._frame_statistics_button.set_label('Shown')
+        else:
+            self._frame_statistics_button.set_label('Hidden')
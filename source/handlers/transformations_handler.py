@@ -81,10 +81,11 @@ class TransformationsHandler(Handler):
             translation_z = self._translate_z_button.get_value()
 
             object_in_focus.translate(Vector(translation_x, translation_y, translation_z))
+            self._handler_mediator.viewport_handler.request_redraw()
             self._handler_mediator.object_transform_handler.update_spin_buttons()
             self.update_rotation_anchor_spin_buttons()
 
-            object_index = object_manager.objects.index(object_in_focus)
+            object_index = object_manager.index_of(object_in_focus)
             object_manager.update_object_info(object_index)
 
     def rescale(self, _) -> None:
@@ -100,6 +101,7 @@ class TransformationsHandler(Handler):
             scale_z = self._rescale_z_button.get_value()
 
             object_in_focus.rescale(Vector(scale_x, scale_y, scale_z))
+            self._handler_mediator.viewport_handler.request_redraw()
             self._handler_mediator.object_transform_handler.update_spin_buttons()
             self.update_rotation_anchor_spin_buttons()
 
@@ -114,6 +116,7 @@ class TransformationsHandler(Handler):
             angle = self._rotation_button.get_value()
 
             object_in_focus.rotate(Vector(0.0, 0.0, angle), self._rotation_anchor)
+            self._handler_mediator.viewport_handler.request_redraw()
             self._handler_mediator.object_transform_handler.update_spin_buttons()
             self.update_rotation_anchor_spin_buttons()
 
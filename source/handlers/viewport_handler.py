@@ -5,12 +5,15 @@ Módulo para o handler do viewport.
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+import numpy as np
 from gi.repository import Gtk, Gdk
 
 from source.backend.math.vector import Vector
 from source.handlers.handler import Handler
+from source.handlers.redraw_scheduler import RedrawScheduler
 
 if TYPE_CHECKING:
+    from source.backend.objects.object import Object
     from source.handlers.handler_mediator import HandlerMediator
     from source.handlers.main_window import MainWindow
 
@@ -24,6 +27,7 @@ class ViewportHandler(Handler):
     _window_movement_magnitude: float
     _drag_coord: Vector | None
     _viewport_drawing_area: Gtk.DrawingArea
+    _redraw_scheduler: RedrawScheduler
 
     def __init__(self, handler_mediator: HandlerMediator, main_window: MainWindow) -> None:
         super().__init__(handler_mediator)
@@ -32,6 +36,7 @@ class ViewportHandler(Handler):
         self._drag_coord = None
 
         self._viewport_drawing_area = main_window.viewport_drawing_area
+        self._redraw_scheduler = RedrawScheduler(self._viewport_drawing_area)
 
         self._viewport_drawing_area.connect('draw', self.on_draw)
         self._viewport_drawing_area.set_events(Gdk.EventMask.ALL_EVENTS_MASK)
@@ -49,7 +54,13 @@ class ViewportHandler(Handler):
         width, height = area.get_allocated_width(), area.get_allocated_height()
 
         self._handler_mediator.manager_mediator.viewport_manager.draw_frame(area, context, width, height)
-        self._viewport_drawing_area.queue_draw()
+
+    def request_redraw(self) -> None:
+        '''
+        Solicita o redesenho do viewport após uma mudança na cena, na window ou no viewport.
+        '''
+
+        self._redraw_scheduler.request_redraw()
 
     def handle_key_press(self, key: str) -> None:
         '''
@@ -109,16 +120,31 @@ class ViewportHandler(Handler):
         '''
 
         position = Vector(event.x, event.y)
+        screen_position = np.array([event.x, event.y])
         viewport_manager = self._handler_mediator.manager_mediator.viewport_manager
 
         width, height = widget.get_allocated_width(), widget.get_allocated_height()
 
         if event.button == 1:
-            self._handler_mediator.creator_handler.add_point(viewport_manager.screen_to_world(position,
-                                                                                              width,
-                                                                                              height))
+            world_position = viewport_manager.screen_to_world(screen_position, width, height)
+            self._handler_mediator.creator_handler.add_point(Vector(world_position[0], world_position[1]))
         elif event.button == 2:
             self._drag_coord = position
+        elif event.button == 3:
+            self.focus_object(viewport_manager.pick_object(screen_position, width, height))
+
+    def focus_object(self, obj: Object | None) -> None:
+        '''
+        Coloca em foco o objeto selecionado no viewport.
+        '''
+
+        if obj is None:
+            return
+
+        self._handler_mediator.manager_mediator.object_manager.object_in_focus = obj
+        self._handler_mediator.transformations_handler.update_object_rotation_anchor(obj.position)
+        self._handler_mediator.object_transform_handler.update_spin_buttons()
+        self._handler_mediator.transformations_handler.update_rotation_anchor_spin_buttons()
 
     def on_mouse_motion(self, _, event):
         '''
@@ -167,3 +193,4 @@ class ViewportHandler(Handler):
         window.rescale(Vector(user_data.width / (window.extension.x - window.origin.x),
                               user_data.height / (window.extension.y - window.origin.y),
                               1.0))
+        self.request_redraw()
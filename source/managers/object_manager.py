@@ -5,10 +5,13 @@ Módulo para o handler do display file.
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from source.backend.objects.object import Object
 from source.backend.objects.wireframes_2d import Line
 from source.backend.file_system import FileSystem
 from source.backend.math.vector import Vector
+from source.backend.rendering.bounding_volume_hierarchy import BoundingVolumeHierarchy
 from source.managers.manager import Manager
 
 if TYPE_CHECKING:
@@ -23,6 +26,8 @@ class ObjectManager(Manager):
 
     _default_objects: list[Object]
     _objects: list[Object]
+    _index_of: dict[Object, int]
+    _bvh: BoundingVolumeHierarchy
     _file_system: FileSystem
     _object_in_focus: Object | None
 
@@ -31,6 +36,8 @@ class ObjectManager(Manager):
 
         self._default_objects = []
         self._objects = []
+        self._index_of = {}
+        self._bvh = BoundingVolumeHierarchy()
         self._file_system = FileSystem()
         self._object_in_focus = None
 
@@ -38,6 +45,9 @@ class ObjectManager(Manager):
         self._default_objects.append(Line(Vector(0.0, 100.0, 0.0), Vector(0.0, 0.0, 0.0), 'Y Axis', (0.25, 1.0, 0.25)))
         self._default_objects.append(Line(Vector(0.0, 0.0, 100.0), Vector(0.0, 0.0, 0.0), 'Z Axis', (0.25, 0.25, 1.0)))
 
+        for obj in self._default_objects:
+            self._bvh.insert(obj)
+
     @property
     def objects(self) -> list[Object]:
         '''
@@ -81,10 +91,53 @@ class ObjectManager(Manager):
         Adiciona um objeto.
         '''
 
+        self._index_of[obj] = len(self._objects)
         self._objects.append(obj)
+        self._bvh.insert(obj)
+        obj.on_transform = self._bvh.update
 
         object_list_handler = self._manager_mediator.handler_mediator.object_list_handler
         object_list_handler.add_object_register(obj)
+        self._manager_mediator.viewport_manager.request_redraw()
+
+    def index_of(self, obj: Object) -> int:
+        '''
+        Retorna o índice de um objeto da lista.
+        '''
+
+        return self._index_of[obj]
+
+    def query_objects(self, planes: np.ndarray) -> list[Object]:
+        '''
+        Retorna, na ordem de desenho, os objetos que podem interceptar o volume delimitado pelos planos de mundo.
+        '''
+
+        objects = self._bvh.query(planes)
+        default_count = len(self._objects)
+        default_index_of = {obj: default_count + i for i, obj in enumerate(self._default_objects)}
+
+        return sorted(objects, key=lambda obj: self._index_of.get(obj, default_index_of.get(obj, 0)))
+
+    def pick_object(self, planes: np.ndarray, point: np.ndarray, tolerance: float) -> Object | None:
+        '''
+        Retorna o objeto da lista mais próximo de um ponto normalizado, entre os que interceptam o volume de
+        seleção, ou None se nenhum estiver dentro da tolerância.
+        '''
+
+        picked_object = None
+        picked_distance = tolerance
+
+        for obj in self._bvh.query(planes):
+            if obj not in self._index_of:
+                continue
+
+            distance = obj.distance_to(point)
+
+            if distance <= picked_distance:
+                picked_object = obj
+                picked_distance = distance
+
+        return picked_object
 
     def update_object_info(self, index: int) -> None:
         '''
@@ -102,20 +155,16 @@ class ObjectManager(Manager):
         if len(self._objects) > 0:
             object_list_handler = self._manager_mediator.handler_mediator.object_list_handler
 
-            self._objects.pop()
-            object_list_handler.remove_object_register(-1)
+            obj = self._objects.pop()
+            del self._index_of[obj]
+            self._bvh.remove(obj)
+            obj.on_transform = None
 
-    def load_file(self, file_name: str) -> None:
-        '''
-        Carrega um arquivo.
-        '''
-
-        loaded = self._file_system.load_scene(file_name)
+            if self._object_in_focus is obj:
+                self._object_in_focus = None
 
-        for obj in loaded:
-            self.add_object(obj)
-
-        self._object_in_focus = self._objects[-1]
+            object_list_handler.remove_object_register(-1)
+            self._manager_mediator.viewport_manager.request_redraw()
 
     def save_file(self, file_name: str) -> None:
         '''
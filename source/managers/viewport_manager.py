@@ -5,13 +5,18 @@ Neste módulo estão definidos os funcionamentos do viewport.
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from source.backend.math.vector import Vector
 from source.backend.objects.window import Window
 from source.backend.rendering.clipper import Clipper
 from source.backend.rendering.frame_generator import FrameGenerator
+from source.backend.rendering.homogeneous_clipper import HomogeneousClipper
+from source.backend.rendering.viewport_transform import ViewportTransform
 from source.managers.manager import Manager
 
 if TYPE_CHECKING:
+    from source.backend.objects.object import Object
     from source.managers.manager_mediator import ManagerMediator
 
 
@@ -25,6 +30,9 @@ class ViewportManager(Manager):
     _window: Window
     _viewport_padding: Vector
     _clipper: Clipper
+    _pick_tolerance: float
+    _viewport_transform: ViewportTransform | None
+    _show_frame_statistics: bool
 
     def __init__(self,
                  manager_mediator: ManagerMediator,
@@ -40,6 +48,9 @@ class ViewportManager(Manager):
                               2.0)
         self._viewport_padding = viewport_padding
         self._clipper = Clipper()
+        self._pick_tolerance = 5.0
+        self._viewport_transform = None
+        self._show_frame_statistics = False
 
     @property
     def window(self) -> Window:
@@ -49,39 +60,79 @@ class ViewportManager(Manager):
 
         return self._window
 
-    def world_to_screen(self, coord: Vector, screen_width: int, screen_height: int) -> Vector:
+    def viewport_transform(self, screen_width: int, screen_height: int) -> ViewportTransform:
         '''
-        Converte a coordenada de mundo para uma coordenada de tela.
+        Retorna a transformada entre a window normalizada (com a margem do viewport) e a tela.
+
+        A window normalizada é fixa, então a transformada só é refeita quando o tamanho da tela muda.
         '''
 
-        origin = self._window.normalized_origin - self._viewport_padding
-        extension = self._window.normalized_extension + self._viewport_padding
+        if self._viewport_transform is None or not self._viewport_transform.matches(screen_width, screen_height):
+            self._viewport_transform = ViewportTransform(self._window.normalized_origin - self._viewport_padding,
+                                                         self._window.normalized_extension + self._viewport_padding,
+                                                         screen_width,
+                                                         screen_height)
 
-        x_s = ((coord.x - origin.x) / (extension.x - origin.x)) * screen_width
-        y_s = (1 - (coord.y - origin.y) / (extension.y - origin.y)) * screen_height
+        return self._viewport_transform
 
-        return Vector(x_s, y_s)
+    def world_to_screen(self, coords: np.ndarray, screen_width: int, screen_height: int) -> np.ndarray:
+        '''
+        Converte coordenadas normalizadas (..., 2), como um array de linhas (E, 2, 2), para coordenadas de tela.
+        '''
 
-    def world_line_to_screen(self, line: list[Vector], screen_width: int, screen_height: int) -> tuple[Vector]:
+        return self.viewport_transform(screen_width, screen_height).to_screen(coords)
+
+    def screen_to_normalized(self, coords: np.ndarray, screen_width: int, screen_height: int) -> np.ndarray:
         '''
-        Converte uma linha no mundo para uma linha na tela.
+        Converte coordenadas de tela (..., 2) para coordenadas normalizadas.
         '''
 
-        return (self.world_to_screen(line[0], screen_width, screen_height),
-                self.world_to_screen(line[1], screen_width, screen_height))
+        return self.viewport_transform(screen_width, screen_height).from_screen(coords)
 
-    def screen_to_world(self, coord: Vector, screen_width: int, screen_height: int) -> Vector:
+    def screen_to_world(self, coords: np.ndarray, screen_width: int, screen_height: int) -> np.ndarray:
         '''
-        Converte a coordenada de tela para uma coordenada de mundo.
+        Converte coordenadas de tela (..., 2) para coordenadas de mundo no plano da window.
         '''
 
-        origin = self._window.origin - self._viewport_padding
-        extension = self._window.extension + self._viewport_padding
+        transform = ViewportTransform(self._window.origin - self._viewport_padding,
+                                      self._window.extension + self._viewport_padding,
+                                      screen_width,
+                                      screen_height)
+
+        return transform.from_screen(coords)
+
+    def pick_object(self, coord: np.ndarray, screen_width: int, screen_height: int) -> Object | None:
+        '''
+        Retorna o objeto sob a coordenada de tela.
+
+        A seleção usa um volume de visão estreito ao redor do cursor para consultar o índice espacial e depois
+        compara a distância do cursor às linhas normalizadas dos candidatos; objetos preenchidos também são
+        selecionados por pontos em seu interior.
+        '''
+
+        point = self.screen_to_normalized(coord, screen_width, screen_height)
+        tolerance = self._pick_tolerance / self.viewport_transform(screen_width, screen_height).scale[0]
+
+        frame_context = FrameGenerator.build_frame_context(self._window)
+        pick_window_planes = HomogeneousClipper.build_window_planes(point[0] - tolerance,
+                                                                    point[1] - tolerance,
+                                                                    point[0] + tolerance,
+                                                                    point[1] + tolerance)
+        pick_planes = HomogeneousClipper.build_view_planes(frame_context.transformation, pick_window_planes)
+
+        object_manager = self._manager_mediator.object_manager
 
-        x_w = (coord.x / screen_width) * (extension.x - origin.x) + origin.x
-        y_w = (1.0 - (coord.y / screen_height)) * (extension.y - origin.y) + origin.y
+        # Os candidatos são atualizados fora de generate_frame para não sobrescrever as estatísticas do frame
+        FrameGenerator.update_objects(frame_context, object_manager.query_objects(pick_planes))
 
-        return Vector(x_w, y_w)
+        return object_manager.pick_object(pick_planes, point, tolerance)
+
+    def request_redraw(self) -> None:
+        '''
+        Solicita o redesenho do viewport.
+        '''
+
+        self._manager_mediator.handler_mediator.viewport_handler.request_redraw()
 
     def draw_frame(self, area, context, screen_width: int, screen_height: int) -> None:
         '''
@@ -93,42 +144,100 @@ class ViewportManager(Manager):
         context.rectangle(0, 0, area.get_allocated_width(), area.get_allocated_height())
         context.fill()
 
-        FrameGenerator.generate_frame(self._window, self._manager_mediator.object_manager.objects)
+        # Apenas os objetos cujas caixas interceptam o volume de visão são processados
+        frame_context = FrameGenerator.build_frame_context(self._window)
+        objects = self._manager_mediator.object_manager.query_objects(frame_context.view_planes)
+
+        FrameGenerator.generate_frame(self._window, objects)
+
+        viewport_transform = self.viewport_transform(screen_width, screen_height)
 
-        # Renderiza todos os objetos
-        for obj in self._manager_mediator.object_manager.objects + [self._window]:
-            clipped_lines = []
+        # Renderiza todos os objetos; linhas consecutivas com o mesmo pincel formam um único caminho
+        stroke_style = None
 
+        for obj in objects + [self._window]:
             if obj != self._window:
                 clipped_lines = self._clipper.clip(self._window, obj)
             else:
                 clipped_lines = obj.vector_lines
 
-            screen_lines = list(map(lambda x: self.world_line_to_screen(x, screen_width, screen_height),
-                                    clipped_lines))
-            color = obj.color
-            line_width = obj.line_width
+            if len(clipped_lines) == 0:
+                continue
 
-            # Define cor e largura do pincel
-            context.new_path()
-            context.set_source_rgb(color[0], color[1], color[2])
-            context.set_line_width(line_width)
+            screen_lines = viewport_transform.to_screen(clipped_lines)
+            style = (obj.color, obj.line_width)
 
-            if obj.fill and len(screen_lines) > 0:
-                context.move_to(screen_lines[0][0].x, screen_lines[0][0].y)
+            if stroke_style is not None and (obj.fill or style != stroke_style):
+                context.stroke()
+                stroke_style = None
 
-            for line in screen_lines:
-                if obj.fill:
-                    context.line_to(line[1].x, line[1].y)
-                else:
-                    context.move_to(line[0].x, line[0].y)
-                    context.line_to(line[1].x, line[1].y)
-                    context.stroke()
+            if obj.fill:
+                self.fill_polygon(context, screen_lines, style)
+            else:
+                if stroke_style is None:
+                    self.set_pen(context, style)
+                    stroke_style = style
 
-            context.close_path()
+                self.append_lines(context, screen_lines)
 
-            if obj.fill:
-                context.fill()
+        if stroke_style is not None:
+            context.stroke()
+
+        if self._show_frame_statistics:
+            self.draw_frame_statistics(context)
+
+    def draw_frame_statistics(self, context) -> None:
+        '''
+        Escreve no canto do viewport as estatísticas do último frame.
+        '''
+
+        context.set_source_rgb(1.0 - self._bg_color[0], 1.0 - self._bg_color[1], 1.0 - self._bg_color[2])
+        context.set_font_size(12.0)
+        context.move_to(8.0, 16.0)
+        context.show_text(f'{FrameGenerator.updated_objects_per_frame} updated, '
+                          f'{FrameGenerator.culled_objects_per_frame} culled, '
+                          f'{FrameGenerator.decompositions_per_frame} decompositions')
+
+    def set_pen(self, context, style: tuple[tuple, float]) -> None:
+        '''
+        Define cor e largura do pincel.
+        '''
+
+        color, line_width = style
+        context.set_source_rgb(color[0], color[1], color[2])
+        context.set_line_width(line_width)
+
+    def append_lines(self, context, screen_lines: np.ndarray) -> None:
+        '''
+        Adiciona linhas de tela (E, 2, 2) ao caminho atual, sem mover o pincel quando uma linha começa onde a
+        anterior terminou.
+        '''
+
+        connected = np.zeros(len(screen_lines), dtype=bool)
+        connected[1:] = np.all(screen_lines[1:, 0] == screen_lines[:-1, 1], axis=1)
+
+        for (start, end), is_connected in zip(screen_lines.tolist(), connected.tolist()):
+            if not is_connected:
+                context.move_to(start[0], start[1])
+
+            context.line_to(end[0], end[1])
+
+    def fill_polygon(self, context, screen_lines: np.ndarray, style: tuple[tuple, float]) -> None:
+        '''
+        Preenche o polígono formado pelas linhas de tela (E, 2, 2) em um único caminho.
+        '''
+
+        context.new_path()
+        self.set_pen(context, style)
+
+        first = screen_lines[0, 0]
+        context.move_to(first[0], first[1])
+
+        for x, y in screen_lines[:, 1].tolist():
+            context.line_to(x, y)
+
+        context.close_path()
+        context.fill()
 
     def move_window(self, direction: Vector) -> None:
         '''
@@ -136,6 +245,7 @@ class ViewportManager(Manager):
         '''
 
         self._window.translate(direction)
+        self.request_redraw()
 
     def reset_window_position(self) -> None:
         '''
@@ -143,6 +253,7 @@ class ViewportManager(Manager):
         '''
 
         self._window.translate(-self._window.position)
+        self.request_redraw()
 
     def rotate_window(self, rotation: Vector) -> None:
         '''
@@ -150,6 +261,7 @@ class ViewportManager(Manager):
         '''
 
         self._window.rotate(rotation)
+        self.request_redraw()
 
     def reset_window_rotation(self) -> None:
         '''
@@ -159,6 +271,7 @@ class ViewportManager(Manager):
         self._window.rotate(Vector(0.0, 0.0, -self._window.rotation.z))
         self._window.rotate(Vector(0.0, -self._window.rotation.y, 0.0))
         self._window.rotate(Vector(-self._window.rotation.x, 0.0, 0.0))
+        self.request_redraw()
 
     def reescale_window(self, scale: Vector) -> None:
         '''
@@ -166,6 +279,7 @@ class ViewportManager(Manager):
         '''
 
         self._window.rescale(scale)
+        self.request_redraw()
 
     def reset_window_scale(self) -> None:
         '''
@@ -177,6 +291,7 @@ class ViewportManager(Manager):
         diff_z = 1.0 / self._window.scale.z
 
         self._window.rescale(Vector(diff_x, diff_y, diff_z))
+        self.request_redraw()
 
     def resize_window(self, extension: Vector) -> None:
         '''
@@ -188,6 +303,7 @@ class ViewportManager(Manager):
         diff_z = extension.z / self._window.scale.z
 
         self._window.rescale(Vector(diff_x, diff_y, diff_z))
+        self.request_redraw()
 
     def toggle_clipping_method(self) -> None:
         '''
@@ -195,3 +311,12 @@ class ViewportManager(Manager):
         '''
 
         self._clipper.toggle_clipping_method()
+        self.request_redraw()
+
+    def toggle_frame_statistics(self) -> None:
+        '''
+        Mostra ou esconde as estatísticas do frame.
+        '''
+
+        self._show_frame_statistics = not self._show_frame_statistics
+        self.request_redraw()